@@ -0,0 +1,328 @@
+# article_store.py - Persistent SQLite store for scraped RMIT articles
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = "news_articles.db"
+PUBLISHED_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    link_key     TEXT PRIMARY KEY,
+    title        TEXT NOT NULL,
+    link         TEXT NOT NULL,
+    summary      TEXT,
+    published    TEXT,
+    published_at TEXT,
+    days_ago     INTEGER,
+    category     TEXT NOT NULL COLLATE NOCASE,
+    source       TEXT,
+    first_seen   TEXT NOT NULL,
+    last_seen    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_category_published ON articles (category, published_at DESC);
+CREATE TABLE IF NOT EXISTS pages (
+    link_key      TEXT PRIMARY KEY,
+    content_hash  TEXT NOT NULL,
+    metadata      TEXT NOT NULL,
+    fetched_at    TEXT NOT NULL,
+    etag          TEXT,
+    last_modified TEXT
+);
+CREATE TABLE IF NOT EXISTS frontier (
+    url       TEXT PRIMARY KEY,
+    category  TEXT NOT NULL,
+    depth     INTEGER NOT NULL,
+    status    TEXT NOT NULL DEFAULT 'pending',
+    attempts  INTEGER NOT NULL DEFAULT 0,
+    added_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_frontier_pending ON frontier (status, depth);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# A frontier URL that fails this many times is given up on
+FRONTIER_MAX_ATTEMPTS = 3
+
+ARTICLE_COLUMNS = ["title", "link", "summary", "published", "published_at", "days_ago", "category", "source"]
+
+
+def link_key(link):
+    """Normalised link used as the primary key (same rule as the scraper's de-dup)"""
+    return (link or "").strip().lower()
+
+
+def utc_iso(dt):
+    """UTC ISO string, so stored timestamps sort and compare as text"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+def published_at_for(article):
+    """UTC ISO publish timestamp for an article dict, or None if undated.
+
+    Uses `published_at` when present, then the GMT `published` string, then
+    the legacy `days_ago`.
+    """
+    if article.get("published_at"):
+        try:
+            return utc_iso(datetime.fromisoformat(article["published_at"]))
+        except (TypeError, ValueError):
+            pass
+    try:
+        return utc_iso(datetime.strptime(article.get("published", ""), PUBLISHED_FORMAT))
+    except (TypeError, ValueError):
+        if article.get("days_ago") is None:
+            return None
+        return utc_iso(datetime.now(timezone.utc) - timedelta(days=article["days_ago"]))
+
+
+def row_article(row):
+    """Article dict for an ARTICLE_COLUMNS row"""
+    article = dict(row)
+    if article["days_ago"] is None:
+        # Only legacy rows carry a frozen day count
+        del article["days_ago"]
+    return article
+
+
+class ArticleStore:
+    """Articles keyed by normalised link, indexed by category and publish date.
+
+    One connection is shared between Streamlit sessions and the background
+    refresher, so every statement runs under a lock.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def upsert(self, articles, is_placeholder=None):
+        """Insert new articles and refresh the fields of ones we already have.
+
+        Re-scraped listings carry less than an enriched row, so an existing
+        row keeps its publish time when the new one is undated, its category
+        when the new one is the generic "All News", and its summary when
+        `is_placeholder(article)` says the new summary is a fallback.
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for article in articles:
+            key = link_key(article.get("link"))
+            if not key or key == "#":
+                continue
+            rows.append((
+                key,
+                article.get("title", ""),
+                article.get("link", ""),
+                article.get("summary", ""),
+                article.get("published", ""),
+                published_at_for(article),
+                article.get("days_ago"),
+                article.get("category", "All News"),
+                article.get("source", ""),
+                now,
+                now,
+                bool(is_placeholder and is_placeholder(article)),
+            ))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO articles (link_key, title, link, summary, published, published_at,
+                                      days_ago, category, source, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(link_key) DO UPDATE SET
+                    title = excluded.title,
+                    link = excluded.link,
+                    summary = CASE WHEN ? THEN articles.summary ELSE excluded.summary END,
+                    published = CASE WHEN excluded.published_at IS NULL
+                                     THEN articles.published ELSE excluded.published END,
+                    published_at = COALESCE(excluded.published_at, articles.published_at),
+                    days_ago = CASE WHEN excluded.published_at IS NULL
+                                    THEN articles.days_ago ELSE excluded.days_ago END,
+                    category = CASE WHEN excluded.category = 'All News'
+                                    THEN articles.category ELSE excluded.category END,
+                    source = excluded.source,
+                    last_seen = excluded.last_seen
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def query(self, category=None, published_since=None, limit=None):
+        """Articles newest first (undated last), optionally within a category and published since a time.
+
+        `category` of None or "All News" means every category; both filters
+        are answered from the (category, published_at) indexes.
+        """
+        sql = f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles"
+        clauses, params = [], []
+        if category and category != "All News":
+            clauses.append("category = ?")
+            params.append(category)
+        if published_since is not None:
+            clauses.append("published_at >= ?")
+            params.append(utc_iso(published_since))
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        # SQLite sorts NULLs lowest, so undated rows come last
+        sql += " ORDER BY published_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [row_article(row) for row in rows]
+
+    def get_articles(self, links):
+        """Stored article dicts for the given links, in no particular order"""
+        keys = [link_key(link) for link in links]
+        articles = []
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles "
+                    f"WHERE link_key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                articles.extend(row_article(row) for row in rows)
+        return articles
+
+    def known_links(self):
+        """Every normalised link in the store"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT link_key FROM articles")}
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def get_pages(self, links):
+        """{link_key: (content hash, metadata, validators)} for article pages fetched before.
+
+        validators holds the page's "etag" and "last_modified" (None if unknown).
+        """
+        keys = [link_key(link) for link in links]
+        pages = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT link_key, content_hash, metadata, etag, last_modified FROM pages "
+                    f"WHERE link_key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    pages[row[0]] = (row[1], json.loads(row[2]), {"etag": row[3], "last_modified": row[4]})
+        return pages
+
+    def save_pages(self, pages):
+        """Remember the content hash, extracted metadata and validators of fetched article pages"""
+        now = datetime.now().isoformat()
+        rows = [(link_key(key), content_hash, json.dumps(metadata), now,
+                 (validators or {}).get("etag"), (validators or {}).get("last_modified"))
+                for key, (content_hash, metadata, validators) in pages.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO pages (link_key, content_hash, metadata, fetched_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(link_key) DO UPDATE SET content_hash = excluded.content_hash, "
+                "metadata = excluded.metadata, fetched_at = excluded.fetched_at, "
+                "etag = excluded.etag, last_modified = excluded.last_modified",
+                rows,
+            )
+
+    def placeholder_articles(self, limit, checked_before):
+        """Newest articles that may still carry a placeholder summary, as query() dicts.
+
+        Only rows whose page was never fetched, or last fetched before
+        `checked_before`, are returned. The summary match is a coarse LIKE;
+        callers apply the exact placeholder test.
+        """
+        columns = ", ".join(f"a.{column}" for column in ARTICLE_COLUMNS)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM articles a LEFT JOIN pages p ON p.link_key = a.link_key "
+                "WHERE a.summary LIKE '% news from RMIT University' "
+                "AND (p.fetched_at IS NULL OR p.fetched_at < ?) "
+                "ORDER BY a.published_at DESC LIMIT ?",
+                (checked_before.isoformat(), limit),
+            ).fetchall()
+        return [row_article(row) for row in rows]
+
+    def enqueue_frontier(self, entries):
+        """Add (url, category, depth) listing pages to the crawl frontier.
+
+        URLs already in the frontier, crawled or not, are ignored, so the
+        table doubles as the visited set. Returns how many were new.
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO frontier (url, category, depth, added_at) VALUES (?, ?, ?, ?)",
+                [(url, category, depth, now) for url, category, depth in entries],
+            )
+            return self._conn.total_changes - before
+
+    def next_frontier(self, limit):
+        """Up to `limit` pending (url, category, depth) entries, shallowest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, category, depth FROM frontier WHERE status = 'pending' "
+                "ORDER BY depth, added_at LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def mark_frontier(self, url, ok=True):
+        """Record a crawl attempt; failures stay pending until FRONTIER_MAX_ATTEMPTS"""
+        with self._lock, self._conn:
+            if ok:
+                self._conn.execute("UPDATE frontier SET status = 'done', attempts = attempts + 1 WHERE url = ?", (url,))
+            else:
+                self._conn.execute(
+                    "UPDATE frontier SET attempts = attempts + 1, "
+                    "status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END WHERE url = ?",
+                    (FRONTIER_MAX_ATTEMPTS, url),
+                )
+
+    def frontier_counts(self):
+        """{status: number of frontier URLs}"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall())
+
+    def reset_frontier(self):
+        """Forget the crawl frontier so the next backfill starts from the seeds"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM frontier")
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
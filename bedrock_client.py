@@ -0,0 +1,293 @@
+# bedrock_client.py - Model invocation helpers for the news assistant
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+try:
+    import boto3
+    from botocore.config import Config
+except ImportError:
+    boto3 = Config = None
+
+# Set to point the runtime client at a local stand-in (see bedrock_stub.py)
+ENDPOINT_URL_ENV = "BEDROCK_ENDPOINT_URL"
+# Refresh temporary credentials this long before they expire
+CREDENTIAL_REFRESH_MARGIN = timedelta(minutes=5)
+MAX_POOL_CONNECTIONS = 10
+ANTHROPIC_VERSION = "bedrock-2023-05-31"
+DEFAULT_MAX_TOKENS = 1000
+
+RESPONSE_CACHE_DB = "response_cache.db"
+RESPONSE_TTL_SECONDS = 6 * 3600
+RESPONSE_CACHE_SIZE = 256
+WHITESPACE_RE = re.compile(r"\s+")
+
+RESPONSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key        TEXT PRIMARY KEY,
+    response   TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def normalise_prompt(prompt_text):
+    """Prompt with whitespace runs collapsed, so layout-only differences share a key"""
+    return WHITESPACE_RE.sub(" ", prompt_text or "").strip()
+
+
+def response_key(model_id, prompt_text, snapshot_version, params=None):
+    """Cache key for one model call (prompt plus inference params) over one article snapshot"""
+    payload = normalise_prompt(prompt_text)
+    if params:
+        payload += "\n" + json.dumps(params, sort_keys=True, default=str)
+    prompt_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{model_id}|{snapshot_version}|{prompt_hash}"
+
+
+class ResponseCache:
+    """Model responses with a TTL, LRU-bounded in memory and optionally on disk.
+
+    Keys come from response_key(), so a new article snapshot or a different
+    model never reuses an old answer. With a `path`, responses also go to a
+    SQLite file and survive restarts; expired rows are pruned on write.
+    """
+
+    def __init__(self, max_entries=RESPONSE_CACHE_SIZE, ttl_seconds=RESPONSE_TTL_SECONDS, path=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory = OrderedDict()  # key -> (created_at, response)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._conn:
+                if path != ":memory:":
+                    self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.executescript(RESPONSE_SCHEMA)
+
+    def __len__(self):
+        return len(self._memory)
+
+    def get(self, key):
+        """Cached response for `key`, or None when missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT created_at, response FROM responses WHERE key = ? AND created_at > ?",
+                    (key, now - self.ttl_seconds),
+                ).fetchone()
+                if row:
+                    self._remember(key, row[0], row[1])
+                    self.disk_hits += 1
+                    return row[1]
+            self.misses += 1
+            return None
+
+    def put(self, key, response):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, response)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT INTO responses (key, response, created_at) VALUES (?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET response = excluded.response, "
+                        "created_at = excluded.created_at",
+                        (key, response, now),
+                    )
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE created_at <= ?", (now - self.ttl_seconds,)
+                    )
+
+    def _remember(self, key, created_at, response):
+        self._memory[key] = (created_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._memory),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+
+def cached_invoke(cache, model_id, prompt_text, snapshot_version, invoke, stream=False, **kwargs):
+    """Answer from `cache` when possible, otherwise call `invoke` and remember the result.
+
+    Returns (response, cached). With `stream`, `invoke` is called with
+    stream=True and must return an iterator of text chunks; the response is
+    then an iterator too (a single chunk on a hit) and is cached once the
+    stream completes. Failed calls raise and are not cached.
+    """
+    key = response_key(model_id, prompt_text, snapshot_version, kwargs)
+    response = cache.get(key)
+    if response is not None:
+        return (iter([response]) if stream else response), True
+    if stream:
+        return _cache_when_complete(cache, key, invoke(prompt_text, stream=True, **kwargs)), False
+    response = invoke(prompt_text, **kwargs)
+    if response:
+        cache.put(key, response)
+    return response, False
+
+
+def _cache_when_complete(cache, key, chunks):
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    if parts:
+        cache.put(key, "".join(parts))
+
+
+class CachedCredentials:
+    """Temporary AWS credentials fetched once and reused until shortly before expiry.
+
+    `fetch` returns a dict shaped like Cognito's get_credentials_for_identity
+    Credentials (AccessKeyId, SecretKey, SessionToken, Expiration); it is only
+    called again once the current set is within `refresh_margin` of expiring.
+    """
+
+    def __init__(self, fetch, refresh_margin=CREDENTIAL_REFRESH_MARGIN):
+        self.fetch = fetch
+        self.refresh_margin = refresh_margin
+        self._credentials = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._credentials is None or self._expiring(self._credentials):
+                self._credentials = self.fetch()
+            return self._credentials
+
+    def _expiring(self, credentials):
+        expiration = credentials.get("Expiration")
+        if expiration is None:
+            return False
+        if isinstance(expiration, str):
+            expiration = datetime.fromisoformat(expiration)
+        if expiration.tzinfo is None:
+            expiration = expiration.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) >= expiration - self.refresh_margin
+
+
+class StaticCredentials:
+    """Fixed credentials, e.g. placeholders for a local stand-in endpoint"""
+
+    def __init__(self, access_key="local", secret_key="local", session_token=None):
+        self._credentials = {"AccessKeyId": access_key, "SecretKey": secret_key,
+                             "SessionToken": session_token}
+
+    def get(self):
+        return self._credentials
+
+
+class BedrockClient:
+    """One pooled bedrock-runtime client, rebuilt only when credentials rotate.
+
+    `endpoint_url` (default: $BEDROCK_ENDPOINT_URL) sends requests to a
+    stand-in server instead of AWS.
+    """
+
+    def __init__(self, credentials, region, model_id, endpoint_url=None,
+                 max_pool_connections=MAX_POOL_CONNECTIONS):
+        self.credentials = credentials
+        self.region = region
+        self.model_id = model_id
+        self.endpoint_url = endpoint_url or os.environ.get(ENDPOINT_URL_ENV) or None
+        self.max_pool_connections = max_pool_connections
+        self._client = None
+        self._client_credentials = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        """The runtime client for the current credentials"""
+        credentials = self.credentials.get()
+        with self._lock:
+            if self._client is None or credentials is not self._client_credentials:
+                if boto3 is None:
+                    raise RuntimeError("boto3 is required to call Bedrock")
+                self._client = boto3.client(
+                    "bedrock-runtime",
+                    region_name=self.region,
+                    endpoint_url=self.endpoint_url,
+                    aws_access_key_id=credentials["AccessKeyId"],
+                    aws_secret_access_key=credentials["SecretKey"],
+                    aws_session_token=credentials.get("SessionToken"),
+                    config=Config(
+                        max_pool_connections=self.max_pool_connections,
+                        retries={"max_attempts": 3, "mode": "adaptive"},
+                    ),
+                )
+                self._client_credentials = credentials
+            return self._client
+
+    def request_body(self, prompt_text, max_tokens=DEFAULT_MAX_TOKENS, temperature=None):
+        body = {
+            "anthropic_version": ANTHROPIC_VERSION,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt_text}],
+        }
+        if temperature is not None:
+            body["temperature"] = temperature
+        return json.dumps(body)
+
+    def invoke(self, prompt_text, **kwargs):
+        """Model reply text for a single user prompt"""
+        response = self.client.invoke_model(
+            modelId=self.model_id,
+            body=self.request_body(prompt_text, **kwargs),
+            contentType="application/json",
+            accept="application/json",
+        )
+        payload = json.loads(response["body"].read())
+        return "".join(part.get("text", "") for part in payload.get("content", []))
+
+    def invoke_stream(self, prompt_text, **kwargs):
+        """Yield reply text chunks as the model generates them"""
+        response = self.client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=self.request_body(prompt_text, **kwargs),
+            contentType="application/json",
+            accept="application/json",
+        )
+        for event in response["body"]:
+            chunk = event.get("chunk")
+            if not chunk:
+                continue
+            payload = json.loads(chunk["bytes"])
+            if payload.get("type") == "content_block_delta":
+                text = payload.get("delta", {}).get("text")
+                if text:
+                    yield text
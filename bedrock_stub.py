@@ -0,0 +1,195 @@
+# bedrock_stub.py - Local stand-in for the bedrock-runtime InvokeModel API
+#
+#   python bedrock_stub.py --port 8765
+#   BEDROCK_ENDPOINT_URL=http://127.0.0.1:8765 streamlit run news_app.py
+import argparse
+import base64
+import json
+import re
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+INVOKE_PATH_RE = re.compile(r"^/model/(?P<model_id>[^/]+)/(?P<operation>invoke|invoke-with-response-stream)$")
+QUESTION_RE = re.compile(r'\*USER QUESTION:\*\s*"(?P<question>.*?)"', re.DOTALL)
+
+
+def stub_reply(prompt_text):
+    """Canned answer that echoes the question, so callers can tell requests apart"""
+    match = QUESTION_RE.search(prompt_text)
+    question = match.group("question") if match else prompt_text[:200]
+    return f"Stub answer to: {question}"
+
+
+def split_words(text):
+    """Text in word-sized chunks, like a model's token stream"""
+    return re.findall(r"\S+\s*", text)
+
+
+def encode_header(name, value):
+    name, value = name.encode("utf-8"), value.encode("utf-8")
+    # Header value type 7 is a string
+    return struct.pack("!B", len(name)) + name + struct.pack("!BH", 7, len(value)) + value
+
+
+def encode_event(payload):
+    """One application/vnd.amazon.eventstream `chunk` message wrapping `payload`"""
+    headers = b"".join([
+        encode_header(":event-type", "chunk"),
+        encode_header(":content-type", "application/json"),
+        encode_header(":message-type", "event"),
+    ])
+    body = json.dumps({"bytes": base64.b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")}).encode("utf-8")
+    total_length = 12 + len(headers) + len(body) + 4
+    prelude = struct.pack("!II", total_length, len(headers))
+    message = prelude + struct.pack("!I", zlib.crc32(prelude)) + headers + body
+    return message + struct.pack("!I", zlib.crc32(message))
+
+
+def stream_events(model_id, text):
+    """Anthropic messages streaming events for a reply of `text`"""
+    yield {"type": "message_start", "message": {"id": "stub", "type": "message", "role": "assistant",
+                                                "model": model_id, "content": []}}
+    yield {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}
+    for word in split_words(text):
+        yield {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": word}}
+    yield {"type": "content_block_stop", "index": 0}
+    yield {"type": "message_delta", "delta": {"stop_reason": "end_turn"}}
+    yield {"type": "message_stop"}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers InvokeModel (JSON) and InvokeModelWithResponseStream (event
+    stream) requests with Anthropic messages-shaped replies; ignores auth"""
+
+    protocol_version = "HTTP/1.1"
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client dropped the connection, e.g. part way through a stream
+            pass
+
+    def do_POST(self):
+        match = INVOKE_PATH_RE.match(self.path)
+        if not match:
+            self.send_error(404, "Unknown operation")
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            prompt_text = body["messages"][-1]["content"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            self.send_error(400, "Malformed request body")
+            return
+
+        self.server.requests += 1
+        model_id = unquote(match.group("model_id"))
+        if match.group("operation") == "invoke-with-response-stream":
+            self.send_stream(model_id, stub_reply(prompt_text))
+            return
+        reply = {
+            "id": f"stub-{self.server.requests}",
+            "type": "message",
+            "role": "assistant",
+            "model": model_id,
+            "content": [{"type": "text", "text": stub_reply(prompt_text)}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": len(prompt_text) // 4, "output_tokens": 0},
+        }
+        data = json.dumps(reply).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_stream(self, model_id, text):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.amazon.eventstream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for payload in stream_events(model_id, text):
+            message = encode_event(payload)
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(message), message))
+            self.wfile.flush()
+            if payload["type"] == "content_block_delta":
+                time.sleep(self.server.chunk_delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port=0, chunk_delay=0.05):
+    """Serve the stub on a background thread; returns (server, endpoint_url).
+
+    Streamed replies pause `chunk_delay` seconds between words.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.requests = 0
+    server.chunk_delay = chunk_delay
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def check_client(chunk_delay=0.05):
+    """Run BedrockClient against a throwaway stub; returns timings in ms"""
+    import bedrock_client
+
+    server, endpoint_url = start_stub_server(chunk_delay=chunk_delay)
+    try:
+        client = bedrock_client.BedrockClient(
+            bedrock_client.StaticCredentials(), "ap-southeast-2", "stub-model", endpoint_url=endpoint_url
+        )
+        prompt_text = '*USER QUESTION:*\n"What research news is there this week?"'
+        expected = stub_reply(prompt_text)
+
+        start = time.perf_counter()
+        assert client.invoke(prompt_text) == expected
+        invoke_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        first_chunk_ms, chunks = None, []
+        for chunk in client.invoke_stream(prompt_text):
+            if first_chunk_ms is None:
+                first_chunk_ms = (time.perf_counter() - start) * 1000
+            chunks.append(chunk)
+        stream_ms = (time.perf_counter() - start) * 1000
+        assert "".join(chunks) == expected, chunks
+        return {"invoke_ms": invoke_ms, "first_chunk_ms": first_chunk_ms,
+                "stream_ms": stream_ms, "chunks": len(chunks)}
+    finally:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Bedrock InvokeModel stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--chunk-delay", type=float, default=0.05,
+                        help="seconds between streamed words")
+    parser.add_argument("--check", action="store_true",
+                        help="exercise BedrockClient against a temporary stub and exit")
+    args = parser.parse_args()
+
+    if args.check:
+        result = check_client(args.chunk_delay)
+        print(f"✅ invoke {result['invoke_ms']:.0f} ms; stream first chunk "
+              f"{result['first_chunk_ms']:.0f} ms, complete {result['stream_ms']:.0f} ms "
+              f"({result['chunks']} chunks)")
+        return
+
+    server, endpoint_url = start_stub_server(args.port, args.chunk_delay)
+    print(f"🧪 Bedrock stub listening on {endpoint_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 
 import streamlit as st
 import json
+import os
 import boto3
-from datetime import datetime, timedelta
+import bedrock_client
+import news_prompt
 import rmit_scraper
 
 # === Premium UI Design - MUST BE FIRST === #
@@ -25,15 +27,22 @@ USERNAME = "s4181965@student.rmit.edu.au"
 PASSWORD = "Annuanna@00"
 
 # === AWS Functions === #
+@st.cache_resource
+def get_cognito_clients():
+    """Cognito clients built once per process rather than per sign-in"""
+    return (
+        boto3.client("cognito-idp", region_name=COGNITO_REGION),
+        boto3.client("cognito-identity", region_name=COGNITO_REGION),
+    )
+
 def get_credentials(username, password):
-    idp_client = boto3.client("cognito-idp", region_name=COGNITO_REGION)
+    idp_client, identity_client = get_cognito_clients()
     response = idp_client.initiate_auth(
         AuthFlow="USER_PASSWORD_AUTH",
         AuthParameters={"USERNAME": username, "PASSWORD": password},
         ClientId=APP_CLIENT_ID,
     )
     id_token = response["AuthenticationResult"]["IdToken"]
-    identity_client = boto3.client("cognito-identity", region_name=COGNITO_REGION)
     identity_response = identity_client.get_id(
         IdentityPoolId=IDENTITY_POOL_ID,
         Logins={f"cognito-idp.{COGNITO_REGION}.amazonaws.com/{USER_POOL_ID}": id_token},
@@ -45,95 +54,36 @@ def get_credentials(username, password):
     return creds_response["Credentials"]
 
 def build_news_prompt(articles, user_question, filters):
-    """Build prompt with filtered articles"""
-    if not articles:
-        return f"""
-I've searched through RMIT's latest news, but no articles match your current filters: {filters}
-
-Please try:
-- Selecting "All RMIT News" to see all available content
-- Adjusting the time period filter
-- Visiting the official RMIT website for complete information
-
-User Question: "{user_question}"
-"""
-    
-    # Format articles for the prompt
-    articles_text = ""
-    for i, article in enumerate(articles[:8], 1):
-        days_ago = article.get('days_ago', 0)
-        if days_ago == 0:
-            recency = "🆕 TODAY"
-        elif days_ago == 1:
-            recency = "📅 YESTERDAY"
-        else:
-            recency = f"📅 {days_ago} DAYS AGO"
-            
-        source_indicator = "🌐 LIVE" if article.get('source') == 'live_rmit' else "📄 SAMPLE"
-        
-        articles_text += f"""
-{i}. *{article.get('title', 'No title')}* {source_indicator}
-   - ⏰ Published: {recency}
-   - 📝 Summary: {article.get('summary', 'No summary available')}
-   - 🔗 Link: {article.get('link', 'Not available')}
-"""
-    
-    prompt = f"""
-You are an RMIT University News Assistant. I've fetched relevant news based on the user's filters.
-
-*CONTEXT:*
-Active Filters: {filters}
-Number of Relevant Articles: {len(articles)}
-Data Source: RMIT University Website
-
-*RELEVANT RMIT NEWS ARTICLES:*
-{articles_text}
-
-*USER QUESTION:*
-"{user_question}"
-
-*IMPORTANT INSTRUCTIONS:*
-1. Use ONLY the provided articles to answer the question
-2. Be specific - mention article titles and key details
-3. Include relevant links when available
-4. If the articles don't fully answer the question, acknowledge this honestly
-5. Keep responses student-focused and helpful
-6. Mention the recency of information when relevant
+    """Build prompt with filtered articles, packed to the prompt token budget"""
+    return news_prompt.build_prompt(articles, user_question, filters)
+
+@st.cache_resource
+def get_bedrock_client():
+    """One bedrock-runtime client and credential cache for the whole server process"""
+    if os.environ.get(bedrock_client.ENDPOINT_URL_ENV):
+        # Local stand-in endpoint: skip the Cognito round trips
+        credentials = bedrock_client.StaticCredentials()
+    else:
+        credentials = bedrock_client.CachedCredentials(lambda: get_credentials(USERNAME, PASSWORD))
+    return bedrock_client.BedrockClient(credentials, BEDROCK_REGION, MODEL_ID)
 
-Provide a comprehensive, accurate response based on these articles.
-"""
-    return prompt
+def invoke_bedrock(prompt_text, stream=False, **kwargs):
+    """Model answer for the prompt, or None when Bedrock can't be reached.
 
-def invoke_bedrock(prompt_text, **kwargs):
+    With `stream`, returns an iterator of text chunks instead; connection
+    errors then surface while iterating.
+    """
+    if stream:
+        return get_bedrock_client().invoke_stream(prompt_text, **kwargs)
+    try:
+        return get_bedrock_client().invoke(prompt_text, **kwargs)
+    except Exception as e:
+        print(f"❌ Bedrock invocation failed: {e}")
+        return None
+
+def demo_answer(prompt_text):
     return "🤖 Demo mode active — AI response not available on Streamlit Cloud.\n\nHere's how your prompt would be processed:\n\n" + prompt_text[:600]
 
-def apply_category_filter(articles, news_category):
-    """Return articles filtered by selected category, or all if 'All News'."""
-    if news_category == "All News":
-        return articles
-    cat = news_category.lower()
-    return [a for a in articles if a.get("category", "All News").lower() == cat]
-
-def filter_articles_by_time(articles, time_period):
-    """Filter articles based on time period"""
-    if time_period == "All Time":
-        return articles
-    
-    current_date = datetime.now()
-    filtered_articles = []
-    
-    for article in articles:
-        days_ago = article.get('days_ago', 999)
-        
-        if time_period == "Last 7 Days" and days_ago <= 7:
-            filtered_articles.append(article)
-        elif time_period == "Last 30 Days" and days_ago <= 30:
-            filtered_articles.append(article)
-        elif time_period == "Last 3 Months" and days_ago <= 90:
-            filtered_articles.append(article)
-    
-    return filtered_articles
-
 # Modern CSS Design
 st.markdown("""
 <style>
@@ -289,9 +239,35 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-# Initialize session state for articles
-if 'articles' not in st.session_state:
-    st.session_state.articles = []
+DEMO_ARTICLES = [
+    {
+        "title": "RMIT launches AI innovation hub",
+        "link": "https://www.rmit.edu.au/news",
+        "summary": "RMIT University unveils its new AI and technology initiative.",
+        "published": "Fri, 31 Oct 2025 13:21:50 GMT",
+        "days_ago": 0,
+        "category": "Technology",
+        "source": "demo_cache"
+    }
+]
+
+@st.cache_resource
+def get_news_refresher():
+    """One refresher, and so one article snapshot, for the whole server process"""
+    return rmit_scraper.get_refresher()
+
+@st.cache_resource
+def get_response_cache():
+    """Model responses shared by every session, persisted across restarts"""
+    return bedrock_client.ResponseCache(path=bedrock_client.RESPONSE_CACHE_DB)
+
+@st.cache_resource
+def get_demo_snapshot():
+    return rmit_scraper.ArticleSnapshot(DEMO_ARTICLES, version=-1)
+
+# Sessions only keep the version of the shared snapshot they are showing
+if 'snapshot_version' not in st.session_state:
+    st.session_state.snapshot_version = None
 
 # Main Layout - Clean 3-column structure
 col1, col2, col3 = st.columns([1, 2, 1])
@@ -319,35 +295,30 @@ with col1:
     st.markdown("---")
     st.markdown("### 📊 Quick Stats")
     
-    # Load news data once and cache it
-    if not st.session_state.articles:
-        with st.spinner("🔄 Loading cached sample news..."):
-            st.session_state.articles = rmit_scraper.load_news_cache() or [
-                {
-                    "title": "RMIT launches AI innovation hub",
-                    "link": "https://www.rmit.edu.au/news",
-                    "summary": "RMIT University unveils its new AI and technology initiative.",
-                    "published": "Fri, 31 Oct 2025 13:21:50 GMT",
-                    "days_ago": 0,
-                    "category": "Technology",
-                    "source": "demo_cache"
-                }
-            ]
+    # Serve the shared snapshot immediately; stale data is refreshed in the
+    # background and picked up here once a newer version is published
+    snapshot = get_news_refresher().get_snapshot()
+    if not snapshot.articles:
+        snapshot = get_demo_snapshot()
+    # Let the reader know when a background refresh has swapped in new
+    # articles since their last rerun (the demo snapshot is version -1)
+    previous_version = st.session_state.snapshot_version
+    if previous_version is not None and snapshot.version > previous_version:
+        st.toast("🆕 Fresh news loaded")
+    st.session_state.snapshot_version = snapshot.version
     
-    articles = st.session_state.articles
+    articles = snapshot.articles
+    # Every (category, period) list and count over the stored history,
+    # computed once per refresh and only looked up on rerun
+    filter_index = snapshot.filter_index
     
     if articles:
-        # Apply time filter for stats
-        time_filtered_articles = filter_articles_by_time(articles, time_period)
-        
-        st.metric("Total Articles", len(time_filtered_articles))
-        
         # Category counts with time filter
         counts = {
-            "All News": len(time_filtered_articles),
-            "Technology": sum(1 for a in time_filtered_articles if a.get('category', '').lower() == 'technology'),
-            "Science": sum(1 for a in time_filtered_articles if a.get('category', '').lower() == 'science')
+            category: filter_index.count(category, time_period)
+            for category in ["All News", "Technology", "Science"]
         }
+        st.metric("Total Articles", counts["All News"])
 
 
         # Display metrics in 2-column layout
@@ -359,7 +330,17 @@ with col1:
         # Time period info
         st.markdown("---")
         st.markdown("### ⏰ Time Filter")
-        st.info(f"Showing: *{time_period}*\n\n**{len(time_filtered_articles)}** articles match your filters")
+        st.info(f"Showing: *{time_period}*\n\n**{counts['All News']}** articles match your filters")
+        
+        cache_state = get_news_refresher().status()
+        if cache_state["age_seconds"] is not None:
+            minutes_old = int(cache_state["age_seconds"] // 60)
+            age_text = "just now" if minutes_old < 1 else f"{minutes_old} min ago"
+            st.caption(f"🕒 News updated {age_text}")
+        if cache_state["refreshing"]:
+            st.caption("🔄 Fetching the latest news in the background...")
+        elif cache_state["last_error"]:
+            st.caption(f"⚠️ Last refresh failed: {cache_state['last_error']}")
         
     else:
         st.info("No articles loaded")
@@ -435,40 +416,67 @@ with col2:
             try:
                 with st.spinner("🔍 Analyzing relevant news..."):
 
-                    filtered_articles = apply_category_filter(articles.copy(), news_category)
-                    filtered_articles = filter_articles_by_time(filtered_articles, time_period)
+                    # The full stored history, already filtered in the snapshot's index
+                    max_days = rmit_scraper.TIME_PERIOD_DAYS.get(time_period)
+                    filtered_articles = filter_index.articles(news_category, time_period)
 
                     # Build filters description
                     filters_desc = f"Category: {news_category}, Time: {time_period}"
                     
                     # Show filtering results
+                    search_category = news_category
                     if filtered_articles:
                         st.success(f"✅ Found {len(filtered_articles)} relevant articles!")
                     else:
                         st.warning(f"⚠️ No articles found for your filters. Showing all articles.")
                         filtered_articles = articles
+                        search_category, max_days = None, None
+                    
+                    # Send the articles most relevant to the question, not just the newest
+                    prompt_articles = rmit_scraper.rank_articles(
+                        user_question, filtered_articles, search_category, max_days
+                    )
                     
                     # Get AI response
-                    prompt = build_news_prompt(filtered_articles, user_question, filters_desc)
-                    answer = invoke_bedrock(prompt)
+                    prompt, prompt_usage = build_news_prompt(prompt_articles, user_question, filters_desc)
+                    # Identical questions over the same snapshot reuse the earlier answer
+                    answer_chunks, from_cache = bedrock_client.cached_invoke(
+                        get_response_cache(), MODEL_ID, prompt, snapshot.tag, invoke_bedrock, stream=True
+                    )
                     
-                    # Display results
+                    # Display results, rendering the answer as it is generated
                     st.markdown("---")
                     st.markdown("### 🤖 News Analysis")
-                    st.write(answer)
+                    try:
+                        st.write_stream(answer_chunks)
+                    except Exception as e:
+                        print(f"❌ Bedrock streaming failed: {e}")
+                        st.write(demo_answer(prompt))
+                    
+                    sections = ", ".join(f"{name} {tokens}" for name, tokens in prompt_usage['sections'].items())
+                    st.caption(
+                        ("⚡ Cached answer · " if from_cache else "") +
+                        f"🧮 Prompt ~{prompt_usage['total']}/{prompt_usage['budget']} tokens ({sections}) · "
+                        f"{prompt_usage['articles_included']} articles, "
+                        f"{prompt_usage['articles_trimmed']} trimmed, {prompt_usage['articles_dropped']} left out"
+                    )
                     
                     # Show articles used
-                    if filtered_articles:
+                    if prompt_articles:
                         st.markdown("---")
-                        st.markdown(f"### 📋 Reference Articles ({len(filtered_articles)} found)")
+                        st.markdown(f"### 📋 Reference Articles ({len(prompt_articles)} of {len(filtered_articles)} most relevant)")
                         
-                        for i, article in enumerate(filtered_articles[:6], 1):
+                        for i, article in enumerate(prompt_articles[:6], 1):
                             source_badge = "🌐 LIVE" if article.get('source') == 'live_rmit' else "📄 SAMPLE"
-                            days_ago = article.get('days_ago', 0)
-                            time_badge = "🆕 TODAY" if days_ago == 0 else f"📅 {days_ago}D"
+                            days_ago = rmit_scraper.article_days_ago(article)
+                            if days_ago is None:
+                                time_badge, published_text = "📅 ?", "Unknown"
+                            else:
+                                time_badge = "🆕 TODAY" if days_ago == 0 else f"📅 {days_ago}D"
+                                published_text = f"{rmit_scraper.display_published(article)} ({days_ago} days ago)"
                             
                             with st.expander(f"{i}. {article.get('title', 'No title')} {source_badge} {time_badge}", expanded=False):
-                                st.write(f"*Published:* {article.get('published', 'Unknown')} ({days_ago} days ago)")
+                                st.write(f"*Published:* {published_text}")
                                 st.write(f"*Summary:* {article.get('summary', 'No summary available')}")
                                 if article.get('link') and article.get('link') != '#':
                                     st.write(f"🔗 [Read full article]({article.get('link')})")
@@ -482,15 +490,17 @@ with col3:
     
     if articles:
 
-        preview_articles = apply_category_filter(articles.copy(), news_category)
-        preview_articles = filter_articles_by_time(preview_articles, time_period)
+        preview_articles = filter_index.articles(news_category, time_period)
 
         # Show up to 3 articles in preview
         for i, article in enumerate(preview_articles[:3]):
             category = article.get('category', 'General')
             source_badge = "🌐" if article.get('source') == 'live_rmit' else "📄"
-            days_ago = article.get('days_ago', 0)
-            time_indicator = "🆕" if days_ago == 0 else f"{days_ago}d"
+            days_ago = rmit_scraper.article_days_ago(article)
+            if days_ago is None:
+                time_indicator = ""
+            else:
+                time_indicator = "🆕" if days_ago == 0 else f"{days_ago}d"
             
             st.markdown(f"""
             <div class="article-card">
@@ -521,8 +531,7 @@ st.markdown("### 🗞️ More Headlines")
 
 if articles:
     # Apply both category and time filters for more headlines
-    more_articles = apply_category_filter(articles.copy(), news_category)
-    more_articles = filter_articles_by_time(more_articles, time_period)
+    more_articles = filter_index.articles(news_category, time_period)
 
     
     # Skip the first 3 articles (already shown in preview) and take next 6
@@ -536,8 +545,11 @@ if articles:
                 with cols[i % 3]:
                     category = article.get('category', 'General')
                     source_badge = "🌐" if article.get('source') == 'live_rmit' else "📄"
-                    days_ago = article.get('days_ago', 0)
-                    time_indicator = "TODAY" if days_ago == 0 else f"{days_ago} days ago"
+                    days_ago = rmit_scraper.article_days_ago(article)
+                    if days_ago is None:
+                        time_indicator = "Date unknown"
+                    else:
+                        time_indicator = "TODAY" if days_ago == 0 else f"{days_ago} days ago"
                     
                     st.markdown(f"""
                     <div style="padding: 1rem; border: 1px solid var(--border); border-radius: 8px; height: 160px; margin-bottom: 1rem; background: white;">
@@ -566,10 +578,8 @@ st.markdown("---")
 col1, col2, col3 = st.columns([1, 2, 1])
 with col2:
     if st.button("🔄 Refresh News Data", use_container_width=True):
-        import os
-        if os.path.exists('news_cache.json'):
-            os.remove('news_cache.json')
-        st.session_state.articles = []
+        # Keep showing the current news while the refresh runs
+        get_news_refresher().refresh(force=True)
         st.rerun()
 
 # Footer
@@ -0,0 +1,158 @@
+# news_prompt.py - Token-budgeted prompt assembly for the news assistant
+import re
+
+import rmit_scraper
+
+# Rough Claude tokenisation for English prose: about four characters a token
+CHARS_PER_TOKEN = 4
+PROMPT_TOKEN_BUDGET = 3000
+# An article is only worth including if this much of its summary fits
+MIN_SUMMARY_TOKENS = 20
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+NO_ARTICLES_TEMPLATE = """
+I've searched through RMIT's latest news, but no articles match your current filters: {filters}
+
+Please try:
+- Selecting "All RMIT News" to see all available content
+- Adjusting the time period filter
+- Visiting the official RMIT website for complete information
+
+User Question: "{user_question}"
+"""
+
+CONTEXT_TEMPLATE = """
+You are an RMIT University News Assistant. I've fetched relevant news based on the user's filters.
+
+*CONTEXT:*
+Active Filters: {filters}
+Number of Relevant Articles: {n_articles}
+Data Source: RMIT University Website
+
+*RELEVANT RMIT NEWS ARTICLES:*
+"""
+
+QUESTION_TEMPLATE = """
+
+*USER QUESTION:*
+"{user_question}"
+"""
+
+INSTRUCTIONS = """
+*IMPORTANT INSTRUCTIONS:*
+1. Use ONLY the provided articles to answer the question
+2. Be specific - mention article titles and key details
+3. Include relevant links when available
+4. If the articles don't fully answer the question, acknowledge this honestly
+5. Keep responses student-focused and helpful
+6. Mention the recency of information when relevant
+
+Provide a comprehensive, accurate response based on these articles.
+"""
+
+
+def estimate_tokens(text):
+    """Approximate token count for `text`"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def trim_to_tokens(text, max_tokens):
+    """Shorten `text` to about `max_tokens`, ending on a sentence or word boundary"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    max_chars = max(max_tokens * CHARS_PER_TOKEN - 1, 0)
+    cut = text[:max_chars]
+    sentences = SENTENCE_END_RE.split(cut)
+    if len(sentences) > 1:
+        # Drop the unfinished last sentence
+        return " ".join(sentences[:-1])
+    word_end = cut.rfind(" ")
+    if word_end > 0:
+        cut = cut[:word_end]
+    return cut.rstrip(" ,;:-") + "…"
+
+
+def recency_label(article):
+    days_ago = rmit_scraper.article_days_ago(article)
+    if days_ago is None:
+        return "📅 DATE UNKNOWN"
+    if days_ago == 0:
+        return "🆕 TODAY"
+    if days_ago == 1:
+        return "📅 YESTERDAY"
+    return f"📅 {days_ago} DAYS AGO"
+
+
+def format_article(i, article, summary):
+    source_indicator = "🌐 LIVE" if article.get('source') == 'live_rmit' else "📄 SAMPLE"
+    return f"""
+{i}. *{article.get('title', 'No title')}* {source_indicator}
+   - ⏰ Published: {recency_label(article)}
+   - 📝 Summary: {summary}
+   - 🔗 Link: {article.get('link', 'Not available')}
+"""
+
+
+def pack_articles(articles, budget):
+    """Format articles in order until `budget` tokens are used.
+
+    `articles` should already be ranked best first. An article that does not
+    fit whole gets its summary trimmed to what is left; once not even a short
+    summary fits, the rest are dropped.
+    Returns (formatted blocks, tokens used, number trimmed).
+    """
+    blocks, used, trimmed = [], 0, 0
+    for article in articles:
+        summary = article.get('summary') or 'No summary available'
+        block = format_article(len(blocks) + 1, article, summary)
+        cost = estimate_tokens(block)
+        if used + cost > budget:
+            overhead = cost - estimate_tokens(summary)
+            room = budget - used - overhead
+            if room < MIN_SUMMARY_TOKENS:
+                break
+            block = format_article(len(blocks) + 1, article, trim_to_tokens(summary, room))
+            cost = estimate_tokens(block)
+            trimmed += 1
+        blocks.append(block)
+        used += cost
+    return blocks, used, trimmed
+
+
+def build_prompt(articles, user_question, filters, budget=PROMPT_TOKEN_BUDGET):
+    """Assemble the assistant prompt within `budget` tokens.
+
+    The context, question and instructions are always included; articles get
+    whatever budget is left. Returns (prompt, usage) where usage maps each
+    section to its estimated tokens plus article counts.
+    """
+    if not articles:
+        prompt = NO_ARTICLES_TEMPLATE.format(filters=filters, user_question=user_question)
+        tokens = estimate_tokens(prompt)
+        return prompt, {"budget": budget, "total": tokens, "sections": {"no_articles": tokens},
+                        "articles_included": 0, "articles_trimmed": 0, "articles_dropped": 0}
+
+    context = CONTEXT_TEMPLATE.format(filters=filters, n_articles=len(articles))
+    question = QUESTION_TEMPLATE.format(user_question=user_question)
+    sections = {
+        "context": estimate_tokens(context),
+        "question": estimate_tokens(question),
+        "instructions": estimate_tokens(INSTRUCTIONS),
+    }
+    blocks, sections["articles"], trimmed = pack_articles(
+        articles, budget - sum(sections.values())
+    )
+
+    parts = [context]
+    parts.extend(blocks)
+    parts.append(question)
+    parts.append(INSTRUCTIONS)
+    usage = {
+        "budget": budget,
+        "total": sum(sections.values()),
+        "sections": sections,
+        "articles_included": len(blocks),
+        "articles_trimmed": trimmed,
+        "articles_dropped": len(articles) - len(blocks),
+    }
+    return "".join(parts), usage
@@ -0,0 +1,199 @@
+# news_search.py - Local BM25 retrieval over article titles and summaries
+import heapq
+import math
+import re
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # scoring falls back to pure Python
+    np = None
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be been but by can for from has have how i in
+into is it its latest me more new news of on or our recent recently rmit s show so some
+that the their there this to university up was what whats which who will with
+""".split())
+# Title words say more about an article than summary words
+TITLE_WEIGHT = 2
+
+
+def stem(token):
+    """Fold simple plurals so "awards" matches "award" """
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Lowercase, plural-folded word tokens without stopwords"""
+    return [stem(t) for t in TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """Incremental inverted index with Okapi BM25 scoring.
+
+    Documents are keyed by normalised article link and carry the category
+    and publish timestamp, so filtered searches only score postings that
+    pass the filters. Per-term BM25 weights (idf and length norm folded in)
+    are computed on first use after the index changes, so a query just sums
+    them; with numpy the sums and filters run over arrays.
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = {}   # term -> {doc_id: term frequency}
+        self.doc_ids = {}    # key -> doc_id
+        self.docs = []       # doc_id -> (key, length, category, published_ts) or None
+        self.doc_terms = []  # doc_id -> indexed terms, so replacing a doc touches only its postings
+        self.total_length = 0
+        self._lock = threading.Lock()
+        self._weights = {}       # term -> precomputed (doc ids, weights), until the next change
+        self._doc_arrays = None  # (category codes, publish timestamps, codes by category) for numpy filters
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    def __contains__(self, key):
+        return key in self.doc_ids
+
+    def add(self, key, title, summary, category="", published_ts=None):
+        """Index one article; re-adding a key replaces its previous entry"""
+        terms = {}
+        for term in tokenize(title):
+            terms[term] = terms.get(term, 0) + TITLE_WEIGHT
+        for term in tokenize(summary):
+            terms[term] = terms.get(term, 0) + 1
+        length = sum(terms.values())
+
+        with self._lock:
+            if key in self.doc_ids:
+                self._remove(key)
+            doc_id = len(self.docs)
+            self.docs.append((key, length, (category or "").lower(), published_ts))
+            self.doc_terms.append(tuple(terms))
+            self.doc_ids[key] = doc_id
+            self.total_length += length
+            for term, tf in terms.items():
+                self.postings.setdefault(term, {})[doc_id] = tf
+            self._invalidate()
+
+    def _remove(self, key):
+        doc_id = self.doc_ids.pop(key)
+        self.total_length -= self.docs[doc_id][1]
+        self.docs[doc_id] = None
+        for term in self.doc_terms[doc_id]:
+            postings = self.postings[term]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[term]
+        self.doc_terms[doc_id] = ()
+        self._invalidate()
+
+    def _invalidate(self):
+        # idf and the average length move with every change, so every weight goes stale
+        self._weights.clear()
+        self._doc_arrays = None
+
+    def _term_weights(self, term):
+        """(doc ids, BM25 weights) for a term's postings, cached until the index changes"""
+        cached = self._weights.get(term)
+        if cached is not None:
+            return cached
+        postings = self.postings.get(term)
+        if not postings:
+            return None
+        n_docs = len(self.doc_ids)
+        avg_length = self.total_length / n_docs
+        idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+        k1, b, docs = self.k1, self.b, self.docs
+        doc_ids = list(postings)
+        weights = [
+            idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * docs[doc_id][1] / avg_length))
+            for doc_id, tf in postings.items()
+        ]
+        if np is not None:
+            cached = (np.array(doc_ids, dtype=np.intp), np.array(weights))
+        else:
+            cached = (doc_ids, weights)
+        self._weights[term] = cached
+        return cached
+
+    def _arrays(self):
+        """Per-doc category codes and publish timestamps (-inf when unknown) as arrays"""
+        if self._doc_arrays is None:
+            codes, published = {}, []
+            category_codes = np.zeros(len(self.docs), dtype=np.intp)
+            for doc_id, doc in enumerate(self.docs):
+                if doc is None:
+                    published.append(-math.inf)
+                    continue
+                category_codes[doc_id] = codes.setdefault(doc[2], len(codes) + 1)
+                published.append(-math.inf if doc[3] is None else doc[3])
+            self._doc_arrays = (category_codes, np.array(published, dtype=float), codes)
+        return self._doc_arrays
+
+    def search(self, query, k=8, category=None, published_since=None):
+        """Top-k (key, score) pairs for `query`, best first.
+
+        `category` (other than "All News") and `published_since` (a POSIX
+        timestamp) restrict the documents that can match.
+        """
+        terms = set(tokenize(query))
+        category = (category or "").lower()
+        if category == "all news":
+            category = ""
+
+        with self._lock:
+            if not terms or not self.doc_ids:
+                return []
+            weighted = [w for w in (self._term_weights(term) for term in terms) if w is not None]
+            if not weighted:
+                return []
+            if np is not None:
+                best = self._top_k_arrays(weighted, k, category, published_since)
+            else:
+                best = self._top_k(weighted, k, category, published_since)
+            return [(self.docs[doc_id][0], score) for doc_id, score in best]
+
+    def _top_k(self, weighted, k, category, published_since):
+        scores = {}
+        docs = self.docs
+        for doc_ids, weights in weighted:
+            if not category and published_since is None:
+                for doc_id, weight in zip(doc_ids, weights):
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight
+                continue
+            for doc_id, weight in zip(doc_ids, weights):
+                doc = docs[doc_id]
+                if category and doc[2] != category:
+                    continue
+                if published_since is not None and (doc[3] is None or doc[3] < published_since):
+                    continue
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        # Best first; ties go to the earlier-indexed doc
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def _top_k_arrays(self, weighted, k, category, published_since):
+        scores = np.zeros(len(self.docs))
+        for doc_ids, weights in weighted:
+            # A term lists each doc once, so fancy-index addition is exact
+            scores[doc_ids] += weights
+        matched = np.flatnonzero(scores)
+        if category or published_since is not None:
+            category_codes, published, codes = self._arrays()
+            keep = np.ones(len(matched), dtype=bool)
+            if category:
+                keep &= category_codes[matched] == codes.get(category, -1)
+            if published_since is not None:
+                keep &= published[matched] >= published_since
+            matched = matched[keep]
+        if len(matched) > k:
+            # Keep everything tied with the k-th best, so the tie-break below decides
+            kth_score = np.partition(scores[matched], len(matched) - k)[len(matched) - k]
+            matched = matched[scores[matched] >= kth_score]
+        # Best first; ties go to the earlier-indexed doc
+        matched = matched[np.lexsort((matched, -scores[matched]))][:k]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in matched]
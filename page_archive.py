@@ -0,0 +1,172 @@
+# page_archive.py - Compressed, content-addressed archive of fetched listing pages
+#
+#   python page_archive.py stats
+#   python page_archive.py reextract [--workers N] [--save]
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+
+ARCHIVE_DIR = "page_archive"
+COMPRESSION_LEVEL = 6
+# Response headers worth keeping with a page
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date", "Cache-Control")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetches (
+    id           INTEGER PRIMARY KEY,
+    url          TEXT NOT NULL,
+    category     TEXT,
+    content_hash TEXT NOT NULL,
+    fetched_at   TEXT NOT NULL,
+    headers      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fetches_url ON fetches (url, fetched_at DESC);
+"""
+
+
+class PageArchive:
+    """Raw page bodies stored once per SHA-256, zlib-compressed, with a fetch log.
+
+    Bodies live under objects/<2 hex>/<hash>.z, so a page that did not
+    change between fetches costs one index row. The index records the URL,
+    category, fetch time and selected headers of every fetch.
+    """
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, "index.db"), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def object_path(self, content_hash):
+        return os.path.join(self.root, "objects", content_hash[:2], content_hash + ".z")
+
+    def put(self, url, content, headers=None, category=None):
+        """Archive one fetch of `url`; returns the content hash"""
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self.object_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename, so a crash never leaves a truncated object
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(zlib.compress(content, COMPRESSION_LEVEL))
+            os.replace(tmp_path, path)
+
+        kept = {name: headers[name] for name in KEPT_HEADERS if headers and headers.get(name)}
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO fetches (url, category, content_hash, fetched_at, headers) VALUES (?, ?, ?, ?, ?)",
+                (url, category, content_hash, datetime.now().isoformat(), json.dumps(kept)),
+            )
+        return content_hash
+
+    def get(self, content_hash):
+        """Decompressed page body for a content hash"""
+        with open(self.object_path(content_hash), "rb") as f:
+            return zlib.decompress(f.read())
+
+    def fetches(self, latest_only=True):
+        """Archived fetches as dicts (url, category, content_hash, fetched_at, headers), oldest first.
+
+        With `latest_only`, just the most recent fetch of each URL.
+        """
+        sql = "SELECT url, category, content_hash, fetched_at, headers FROM fetches"
+        if latest_only:
+            sql += " WHERE id IN (SELECT MAX(id) FROM fetches GROUP BY url)"
+        sql += " ORDER BY id"
+        with self._lock:
+            rows = self._conn.execute(sql).fetchall()
+        return [
+            {"url": url, "category": category, "content_hash": content_hash,
+             "fetched_at": fetched_at, "headers": json.loads(headers)}
+            for url, category, content_hash, fetched_at, headers in rows
+        ]
+
+    def stats(self):
+        with self._lock:
+            fetch_count, url_count, object_count = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT url), COUNT(DISTINCT content_hash) FROM fetches"
+            ).fetchone()
+        stored_bytes = 0
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, "objects")):
+            stored_bytes += sum(os.path.getsize(os.path.join(dirpath, name)) for name in filenames)
+        return {"fetches": fetch_count, "urls": url_count, "objects": object_count,
+                "stored_bytes": stored_bytes}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def reextract(archive, scraper, workers=0, latest_only=True):
+    """Rerun the listing extraction over archived pages, without the network.
+
+    Returns (articles, pages parsed, seconds). With `workers`, pages are
+    parsed in a ParsePool of that many processes.
+    """
+    import rmit_scraper
+
+    tasks = []
+    for fetch in archive.fetches(latest_only):
+        content, _ = rmit_scraper.listing_html(
+            archive.get(fetch["content_hash"]), fetch["headers"].get("Content-Type", ""), fetch["url"]
+        )
+        tasks.append((content, fetch["category"] or "all_news", fetch["url"]))
+
+    start = time.perf_counter()
+    if workers:
+        with rmit_scraper.ParsePool(workers, scraper.parser_backend) as pool:
+            parsed = list(pool.parse(tasks, chunksize=8))
+    else:
+        parsed = [scraper.parse_listing_page(*task) for task in tasks]
+    elapsed = time.perf_counter() - start
+
+    articles, seen = [], set()
+    for page_articles, _ in parsed:
+        for article in page_articles:
+            link = rmit_scraper.normalise_link(article.get("link"))
+            if link and link not in seen:
+                seen.add(link)
+                articles.append(article)
+    return articles, len(tasks), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or re-extract the raw page archive")
+    parser.add_argument("command", choices=["stats", "reextract"])
+    parser.add_argument("--root", default=ARCHIVE_DIR)
+    parser.add_argument("--workers", type=int, default=0, help="parse in this many processes")
+    parser.add_argument("--all-fetches", action="store_true",
+                        help="re-extract every archived fetch, not just the latest per URL")
+    parser.add_argument("--save", action="store_true", help="write re-extracted articles to the article store")
+    args = parser.parse_args()
+
+    archive = PageArchive(args.root)
+    if args.command == "stats":
+        stats = archive.stats()
+        print(f"🗄️ {stats['fetches']} fetches of {stats['urls']} URLs, {stats['objects']} distinct pages, "
+              f"{stats['stored_bytes'] / 1024:.0f} KB on disk")
+        return
+
+    import rmit_scraper
+
+    scraper = rmit_scraper.RMITLiveScraper(concurrent=False)
+    articles, pages, elapsed = reextract(archive, scraper, args.workers, not args.all_fetches)
+    rate = pages / elapsed if elapsed else 0
+    print(f"🔁 Re-extracted {len(articles)} articles from {pages} pages in {elapsed:.2f}s ({rate:.0f} pages/s)")
+    if args.save and articles:
+        rmit_scraper.save_news_cache(articles)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,642 @@
 # rmit_scraper.py - Enhanced with Real Date Scraping
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+import hashlib
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import time
 import re
 import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse
+
+import article_store
+import news_search
+import page_archive
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # columnar filtering is optional
+    np = pd = None
+
+# Candidate node matching for the listing strategies
+NEWS_ITEM_CLASS_RE = re.compile(r'news|card|item', re.I)
+NEWS_LINK_RE = re.compile(r'/news/')
+CARD_CLASSES = ['card', 'news-card', 'news-item', 'listing-item']
+CARD_SELECTORS = ['[data-component="card"]'] + ['.' + cls for cls in CARD_CLASSES]
+NEWS_ITEM_LIMIT = 12
+CARD_LIMIT = 8
+ARTICLE_LIMIT = 8
+NEWS_LINK_LIMIT = 12
+# Incremental scrapes stop walking a listing after this many known links in a row
+KNOWN_LINK_RUN_LIMIT = 3
+# Most recent articles held in memory for display; the store keeps the full history
+MAX_CACHED_ARTICLES = 200
+# A listing scrape stops trying further strategies once it has this many articles
+ENOUGH_ARTICLES = 8
+
+
+def normalise_link(link):
+    """Key used to de-duplicate articles across strategies, categories and refreshes"""
+    return (link or '').strip().lower()
+
+# Date extraction and normalisation
+DATE_SELECTORS = [
+    'time[datetime]', 'time', '.date', '.published',
+    '.timestamp', '.news-date', '.card-date', '[datetime]'
+]
+DATE_TEXT_PATTERNS = [
+    re.compile(r'\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b', re.I),   # 5 Feb 2025
+    re.compile(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},\s+\d{4}\b', re.I), # Feb 5, 2025
+    re.compile(r'\b\d{1,2}/\d{1,2}/\d{4}\b'),                                                           # 05/02/2025
+    re.compile(r'\b\d{4}-\d{2}-\d{2}\b'),                                                               # 2025-02-05
+]
+ORDINAL_SUFFIX_RE = re.compile(r'(\d{1,2})(st|nd|rd|th)', re.I)
+ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%d %b %Y',
+    '%d %B %Y',
+    '%b %d, %Y',
+    '%B %d, %Y',
+]
+
+
+@lru_cache(maxsize=4096)
+def parse_date_text(date_text):
+    """Normalise a scraped date string to a datetime, or None.
+
+    ISO values with an offset come back timezone-aware; everything else is
+    naive local (Melbourne) time.
+
+    Results are cached on the raw string: the same dates repeat across
+    categories and refreshes, and parsing does not depend on the clock.
+    """
+    s = date_text.strip()
+
+    # Fast path for machine-readable <time datetime="..."> values
+    if len(s) >= 10 and s[4:5] == '-' and s[:4].isdigit():
+        try:
+            return datetime.fromisoformat(s.replace('Z', '+00:00'))
+        except ValueError:
+            pass
+
+    # Remove ordinal suffixes (1st, 2nd, 3rd, 4th …)
+    s = ORDINAL_SUFFIX_RE.sub(r'\1', s)
+    s = s.replace('\xa0', ' ').replace('–', '-').strip()
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            pass
+
+    # Try ISO-like substring if present
+    m = ISO_DATE_RE.search(s)
+    if m:
+        try:
+            return datetime.strptime(m.group(1), '%Y-%m-%d')
+        except ValueError:
+            pass
+
+    return None
+
+
+# Publish times are stored as absolute, timezone-aware timestamps; "days ago"
+# is derived in RMIT's own timezone whenever it is displayed or filtered on.
+try:
+    from zoneinfo import ZoneInfo
+    RMIT_TZ = ZoneInfo("Australia/Melbourne")
+except Exception:  # no tz database (e.g. Windows without tzdata)
+    RMIT_TZ = timezone(timedelta(hours=10))
+PUBLISHED_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+
+
+def to_rmit_time(dt):
+    """Treat naive datetimes as Melbourne local time; convert aware ones"""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=RMIT_TZ)
+    return dt.astimezone(RMIT_TZ)
+
+
+def format_published(published_at):
+    """RFC-style GMT string for the stored `published` field"""
+    return published_at.astimezone(timezone.utc).strftime(PUBLISHED_FORMAT)
+
+
+def display_published(article):
+    """Publish date as readers see it, in Melbourne ("Tue, 18 Feb 2025"), or "" if undated.
+
+    Date-only listings are midnight Melbourne time, which is the previous
+    day in GMT, so the stored `published` string is not for display.
+    """
+    published_at = article_published_at(article)
+    if published_at is None:
+        return ""
+    if published_at.time() == datetime.min.time():
+        return published_at.strftime("%a, %d %b %Y")
+    return published_at.strftime("%a, %d %b %Y %I:%M %p %Z")
+
+
+def rmit_today():
+    return datetime.now(RMIT_TZ).date()
+
+
+def article_published_at(article):
+    """Timezone-aware publish time of an article, or None if unknown.
+
+    Articles scraped before absolute timestamps only carry a `days_ago`
+    frozen at scrape time; that is used as a last resort.
+    """
+    value = article.get('published_at')
+    if value:
+        try:
+            return to_rmit_time(datetime.fromisoformat(value))
+        except (TypeError, ValueError):
+            pass
+    days_ago = article.get('days_ago')
+    if days_ago is not None:
+        return datetime.now(RMIT_TZ) - timedelta(days=days_ago)
+    return None
+
+
+def article_days_ago(article, today=None):
+    """Whole calendar days since publication in RMIT's timezone, or None"""
+    published_at = article_published_at(article)
+    if published_at is None:
+        return None
+    today = today or rmit_today()
+    return max(0, (today - published_at.date()).days)
+
+
+# BeautifulSoup tree builders, fastest first. Every strategy only uses the
+# bs4 Tag API, so any builder registered with bs4 can slot in here; lxml is
+# used whenever it is installed and html.parser is always available.
+PARSER_BACKENDS = ["lxml", "html.parser"]
+
+
+def available_parser_backends():
+    """Parser backends usable in this environment, fastest first"""
+    return [name for name in PARSER_BACKENDS if builder_registry.lookup(name)]
+
+
+def select_parser_backend(preferred=None):
+    """Return `preferred` if it is installed, else the fastest available backend"""
+    if preferred and builder_registry.lookup(preferred):
+        return preferred
+    if preferred:
+        print(f"⚠️ Parser backend {preferred!r} not installed, falling back")
+    return available_parser_backends()[0]
+
+
+def make_soup(content, backend=None, parse_only=None):
+    """Parse page content with the chosen (or best available) backend"""
+    return BeautifulSoup(content, select_parser_backend(backend), parse_only=parse_only)
+
+
+def is_listing_node(name, attrs):
+    """SoupStrainer filter: keep only subtrees the listing strategies can match.
+
+    Called while parsing, so `class` is still the raw attribute string. List
+    items are kept whole because bare links in them often carry their date
+    as sibling text.
+    """
+    if name in ('article', 'time', 'li'):
+        return True
+    attrs = attrs or {}
+    if name == 'a':
+        return bool(NEWS_LINK_RE.search(attrs.get('href') or ''))
+    if attrs.get('data-component') == 'card':
+        return True
+    classes = attrs.get('class') or ''
+    if isinstance(classes, list):
+        classes = ' '.join(classes)
+    return bool(NEWS_ITEM_CLASS_RE.search(classes))
+
+
+LISTING_STRAINER = SoupStrainer(is_listing_node)
+
+# Summaries the extractors fall back to when a listing only gives us a link
+PLACEHOLDER_SUMMARY_RE = re.compile(r'^(Recent|Latest)( \S+)? news from RMIT University$')
+# Article pages fetched for details per refresh
+ENRICH_LIMIT = 20
+# Stored articles still on a placeholder are re-checked this often
+ENRICH_RECHECK_SECONDS = 24 * 3600
+SUMMARY_MAX_CHARS = 200
+
+
+def is_metadata_node(name, attrs):
+    """SoupStrainer filter: <title>, <meta> and JSON-LD scripts of an article page"""
+    if name in ('title', 'meta'):
+        return True
+    return name == 'script' and (attrs or {}).get('type') == 'application/ld+json'
+
+
+METADATA_STRAINER = SoupStrainer(is_metadata_node)
+
+
+# Listing pagination: rel="next" links, pager links and "load more" endpoints
+NEXT_PAGE_TEXT_RE = re.compile(r'\b(next|older|load more|more news|show more)\b', re.I)
+PAGER_CLASS_RE = re.compile(r'pagination|pager|load-more', re.I)
+LOAD_MORE_ATTRS = ('data-url', 'data-href', 'data-next', 'data-next-page', 'data-load-more')
+PAGE_QUERY_RE = re.compile(r'[?&](page|p|start|offset)=\d+', re.I)
+
+
+def is_listing_url(url):
+    """True for listing pages (a page/offset query) rather than articles"""
+    return bool(PAGE_QUERY_RE.search(url or ''))
+
+
+# Section indexes such as /news, /news/technology or /news/events; articles
+# sit deeper, e.g. /news/all-news/2025/feb/<slug>
+SECTION_PATH_RE = re.compile(r'^/news(/[^/]+)?/?$', re.I)
+
+
+def is_section_url(url):
+    """True for /news section index pages rather than articles"""
+    return bool(SECTION_PATH_RE.match(urlparse(url or '').path))
+
+
+def find_next_pages(soup, page_url):
+    """Absolute URLs of further listing pages linked from a listing page.
+
+    Only same-host /news/ URLs are returned, in document order.
+    """
+    host = urlparse(page_url).netloc
+    found = []
+
+    def add(href):
+        if not href:
+            return
+        url = urljoin(page_url, href.strip()).split('#')[0]
+        parsed = urlparse(url)
+        if parsed.netloc == host and parsed.path.startswith('/news') and url != page_url and url not in found:
+            found.append(url)
+
+    for node in soup.find_all(True):
+        rel = node.get('rel') or []
+        if isinstance(rel, str):
+            rel = rel.split()
+        if node.name in ('a', 'link') and 'next' in rel:
+            add(node.get('href'))
+            continue
+        for attr in LOAD_MORE_ATTRS:
+            if node.get(attr):
+                add(node.get(attr))
+        if node.name != 'a' or not node.get('href'):
+            continue
+        in_pager = any(PAGER_CLASS_RE.search(' '.join(parent.get('class') or []))
+                       for parent in [node] + list(node.parents)[:3] if hasattr(parent, 'get'))
+        if in_pager or NEXT_PAGE_TEXT_RE.search(node.get_text(" ", strip=True)) or is_listing_url(node['href']):
+            add(node['href'])
+    return found
+
+
+def listing_html(content, content_type, url):
+    """Listing HTML and next page URLs from a listing response body.
+
+    "Load more" endpoints may answer with JSON carrying the rendered items
+    under "html" and the next URL under "next"/"nextUrl".
+    """
+    if 'json' not in (content_type or ''):
+        return content, []
+    data = json.loads(content)
+    next_url = data.get('next') or data.get('nextUrl')
+    return data.get('html') or '', [urljoin(url, next_url)] if next_url else []
+
+
+def split_at_horizon(articles, since):
+    """Drop articles published before `since`; returns (articles, reached_horizon).
+
+    Listings run newest first, so any dropped article means older pages
+    are out of range too.
+    """
+    if since is None:
+        return articles, False
+    in_range = [a for a in articles if (article_published_at(a) or since) >= since]
+    return in_range, len(in_range) < len(articles)
+
+
+def needs_enrichment(article):
+    """True for link-only articles that still carry a placeholder summary"""
+    return bool(PLACEHOLDER_SUMMARY_RE.match(article.get('summary') or ''))
+
+
+def clean_summary(text):
+    summary = re.sub(r'\s+', ' ', text or '').strip()
+    if len(summary) > SUMMARY_MAX_CHARS:
+        summary = summary[:SUMMARY_MAX_CHARS - 3] + "..."
+    return summary
+
+
+def iter_json_ld(node):
+    """Every JSON-LD object in a parsed script body, including @graph members"""
+    if isinstance(node, list):
+        for item in node:
+            yield from iter_json_ld(item)
+    elif isinstance(node, dict):
+        yield node
+        yield from iter_json_ld(node.get('@graph'))
+
+
+def extract_page_metadata(content, backend=None):
+    """Summary, publish date and section from an article page's OpenGraph/JSON-LD.
+
+    Returns raw strings under "title", "summary", "published" and "section";
+    keys are missing when the page does not provide them. JSON-LD wins over
+    meta tags, which win over the <title>.
+    """
+    soup = make_soup(content, backend, parse_only=METADATA_STRAINER)
+    metadata = {}
+    title = soup.find('title')
+    if title and title.get_text(strip=True):
+        metadata["title"] = title.get_text(strip=True)
+
+    meta = {}
+    for tag in soup.find_all('meta'):
+        name = tag.get('property') or tag.get('name')
+        if name and tag.get('content') and name not in meta:
+            meta[name] = tag['content'].strip()
+    for key, names in (("title", ["og:title"]),
+                       ("summary", ["og:description", "description"]),
+                       ("published", ["article:published_time"]),
+                       ("section", ["article:section"])):
+        value = next((meta[name] for name in names if meta.get(name)), None)
+        if value:
+            metadata[key] = value
+
+    ld_keys = {"headline": "title", "description": "summary",
+               "datePublished": "published", "articleSection": "section"}
+    for script in soup.find_all('script'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        for node in iter_json_ld(data):
+            for ld_key, key in ld_keys.items():
+                value = node.get(ld_key)
+                if isinstance(value, list):
+                    value = value[0] if value else None
+                if isinstance(value, str) and value.strip():
+                    metadata[key] = value.strip()
+    return metadata
+
+class RateLimiter:
+    """Per-host token bucket: `rate` requests per second, bursts up to `burst`."""
+
+    def __init__(self, rate=0.5, burst=3):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        """Block until a request to the host of `url` is allowed."""
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+def build_session(pool_size=10, retries=3, backoff=0.5):
+    """Shared keep-alive session with bounded retry/backoff on transient errors"""
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+    return session
+
 
 class RMITLiveScraper:
-    def __init__(self):
+    def __init__(self, concurrent=True, max_workers=3, rate_limit=0.5, burst=3, parser_backend=None,
+                 partial_parse=False, partial_parse_min_articles=5, known_run_limit=KNOWN_LINK_RUN_LIMIT,
+                 enrich_details=False, enrich_limit=ENRICH_LIMIT, archive=None):
         self.base_url = "https://www.rmit.edu.au"
         self.news_urls = {
             "all_news": "https://www.rmit.edu.au/news/all-news",
             "technology": "https://www.rmit.edu.au/news/technology", 
             "science": "https://www.rmit.edu.au/news/science"
         }
+        # Concurrent fetching stays polite: every request to a host draws
+        # from the same token bucket instead of sleeping a fixed 2 seconds.
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate=rate_limit, burst=burst)
+        self.parser_backend = select_parser_backend(parser_backend)
+        # Partial parsing skips headers, footers and scripts; if it finds
+        # fewer than partial_parse_min_articles we re-parse the whole page.
+        self.partial_parse = partial_parse
+        self.partial_parse_min_articles = partial_parse_min_articles
+        # Normalised links already in the cache; only set during incremental fetches
+        self.known_links = set()
+        self.known_run_limit = known_run_limit
+        # Fetch link-only articles' own pages for their real summary and date
+        self.enrich_details = enrich_details
+        self.enrich_limit = enrich_limit
+        # PageArchive that keeps every fetched listing body, or None
+        self.archive = archive
+        self.session = build_session(pool_size=max(max_workers, 4))
+        # url -> {"etag", "last_modified", "articles", "complete"} for conditional GETs
+        self.validators = {}
+        self._validators_lock = threading.Lock()
+        # Outcome of the last fetch_all_news: category -> None (fetched) or error text
+        self.listing_status = {}
+
+    def conditional_get(self, url, timeout=15):
+        """GET `url` with If-None-Match/If-Modified-Since from the last response.
+
+        Returns (response, cached_articles). `cached_articles` is the list we
+        parsed last time when the server answers 304, otherwise None.
+        """
+        with self._validators_lock:
+            known = dict(self.validators.get(url, {}))
+        if not known.get("complete") and not self.known_links:
+            # Only new articles were kept last time; a full fetch needs the page
+            known = {}
+        headers = {}
+        if known.get("etag"):
+            headers["If-None-Match"] = known["etag"]
+        if known.get("last_modified"):
+            headers["If-Modified-Since"] = known["last_modified"]
+
+        self.rate_limiter.acquire(url)
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and "articles" in known:
+            return response, known["articles"]
+        response.raise_for_status()
+        return response, None
+
+    def remember_validators(self, url, response, articles):
+        """Store the response's ETag/Last-Modified alongside what we parsed"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        with self._validators_lock:
+            self.validators[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "articles": articles,
+                "complete": not self.known_links,
+            }
     
     def scrape_rmit_news(self, category="all_news"):
         """Scrape real news from RMIT website with real dates"""
         try:
             url = self.news_urls.get(category, self.news_urls["all_news"])
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            
             print(f"📡 Fetching {category} news from: {url}")
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
+            response, cached_articles = self.conditional_get(url)
+            if cached_articles is not None:
+                print(f"♻️ {category} unchanged since last fetch (304)")
+                self.listing_status[category] = None
+                return list(cached_articles)
             
-            # Try multiple scraping strategies
-            articles = self.scrape_with_multiple_strategies(soup, category)
+            self.archive_response(url, response, category)
+            self.listing_status[category] = None
+            articles = self.extract_articles(response.content, category)[:15]
+            self.remember_validators(url, response, articles)
             
             print(f"🎯 Found {len(articles)} articles for {category}")
-            return articles[:15]
+            return articles
             
         except Exception as e:
             print(f"❌ Error scraping {category}: {e}")
+            self.listing_status.setdefault(category, str(e))
             return []
     
-    def scrape_with_multiple_strategies(self, soup, category):
-        """Use multiple strategies to find news articles"""
+    def lost_link_dates(self, soup, articles):
+        """True if an undated article came from a link whose container the strainer dropped.
+
+        Such links end up directly under the document, so any date text that
+        sat next to them in the page is gone.
+        """
+        orphans = {normalise_link(urljoin(self.base_url, a['href']))
+                   for a in soup.find_all('a', href=True, recursive=False)}
+        return any(not article.get('published_at') and normalise_link(article.get('link')) in orphans
+                   for article in articles)
+
+    def extract_articles(self, content, category):
+        """Parse a listing page and run the strategies, partially if enabled"""
+        if self.partial_parse:
+            soup = make_soup(content, self.parser_backend, parse_only=LISTING_STRAINER)
+            articles = self.scrape_with_multiple_strategies(soup, category)
+            if len(articles) < self.partial_parse_min_articles:
+                print(f"↩️ Partial parse found {len(articles)} articles for {category}, using full parse")
+            elif self.lost_link_dates(soup, articles):
+                print(f"↩️ Partial parse dropped link dates for {category}, using full parse")
+            else:
+                return articles
+
+        soup = make_soup(content, self.parser_backend)
+        
+        # Try multiple scraping strategies
+        return self.scrape_with_multiple_strategies(soup, category)
+
+    def collect_candidates(self, soup):
+        """Walk the tree once and bucket the nodes every strategy looks at.
+
+        Buckets keep document order and the same per-strategy caps the
+        individual find_all/select calls used to apply. During an incremental
+        fetch the walk stops once `known_run_limit` known article links have
+        been seen in a row: listings are newest first, so the rest is known.
+        Only links inside news item, card or article candidates count, so
+        header navigation never ends the walk early.
+        """
+        candidates = {
+            "news_items": [],
+            "cards": {selector: [] for selector in CARD_SELECTORS},
+            "articles": [],
+            "links": [],
+        }
+        card_buckets = candidates["cards"]
+        known_run = 0
+        last_known = None
+        # ids of candidate containers, for the known-link run
+        containers = set()
+
+        for node in soup.find_all(True):
+            name = node.name
+            classes = node.get('class') or []
+
+            if (name == 'div' and len(candidates["news_items"]) < NEWS_ITEM_LIMIT
+                    and any(NEWS_ITEM_CLASS_RE.search(c) for c in classes)):
+                candidates["news_items"].append(node)
+                containers.add(id(node))
+
+            if node.get('data-component') == 'card' and len(card_buckets['[data-component="card"]']) < CARD_LIMIT:
+                card_buckets['[data-component="card"]'].append(node)
+                containers.add(id(node))
+            for cls in CARD_CLASSES:
+                if cls in classes and len(card_buckets['.' + cls]) < CARD_LIMIT:
+                    card_buckets['.' + cls].append(node)
+                    containers.add(id(node))
+
+            if name == 'article' and len(candidates["articles"]) < ARTICLE_LIMIT:
+                candidates["articles"].append(node)
+                containers.add(id(node))
+
+            if name == 'a' and len(candidates["links"]) < NEWS_LINK_LIMIT:
+                href = node.get('href')
+                if isinstance(href, str) and NEWS_LINK_RE.search(href):
+                    candidates["links"].append(node)
+
+            if name == 'a' and self.known_links and any(id(p) in containers for p in node.parents):
+                link = normalise_link(self.resolve_href(node.get('href')))
+                if link in self.known_links:
+                    # Cards often link the image and the title to the same page
+                    if link != last_known:
+                        known_run += 1
+                        last_known = link
+                    if known_run >= self.known_run_limit:
+                        break
+                elif link:
+                    known_run = 0
+                    last_known = None
+
+        return candidates
+
+    def resolve_href(self, href):
+        """Absolute article link for an href, matching what extraction stores"""
+        if not isinstance(href, str):
+            return ""
+        if href.startswith('/'):
+            return f"{self.base_url}{href}"
+        if href.startswith('http'):
+            return href
+        return ""
+
+    def scrape_with_multiple_strategies(self, soup, category, enough=ENOUGH_ARTICLES):
+        """Use multiple strategies to find news articles (all of them if `enough` is None)"""
         articles = []
+        # One traversal feeds every strategy below
+        candidates = self.collect_candidates(soup)
         strategies = [
             self.scrape_modern_news_layout,
             self.scrape_news_cards,
@@ -54,15 +646,18 @@ class RMITLiveScraper:
         
         for strategy in strategies:
             try:
-                found_articles = strategy(soup, category)
+                found_articles = strategy(soup, category, candidates)
                 if found_articles:
-                    # Add new articles, avoiding duplicates
+                    # Add new articles, avoiding duplicates and section/pager links
                     existing_links = {a.get('link', '').strip().lower() for a in articles}
+                    existing_links |= self.known_links
                     for article in found_articles:
+                        if is_section_url(article.get('link')) or is_listing_url(article.get('link')):
+                            continue
                         if article.get('link', '').strip().lower() not in existing_links:
                             articles.append(article)
                             existing_links.add(article.get('link', '').strip().lower())
-                    if len(articles) >= 8:
+                    if enough is not None and len(articles) >= enough:
                         break
             except Exception as e:
                 print(f"Strategy failed: {e}")
@@ -70,86 +665,87 @@ class RMITLiveScraper:
         
         return articles
     
-    def scrape_modern_news_layout(self, soup, category):
+    def scrape_modern_news_layout(self, soup, category, candidates=None):
         """Scrape modern RMIT news layout"""
         articles = []
         
         # Look for news items in modern layout
-        news_items = soup.find_all('div', class_=re.compile(r'news|card|item', re.I))
+        if candidates is None:
+            candidates = self.collect_candidates(soup)
         
-        for item in news_items[:12]:
-            try:
-                # Extract title
-                title_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5']) or item.find('a')
-                if not title_elem:
-                    continue
-                    
-                title = title_elem.get_text(strip=True)
-                if not title or len(title) < 10:
-                    continue
-                
-                # Extract link
-                link = "#"
-                link_elem = item.find('a')
-                if link_elem and link_elem.get('href'):
-                    href = link_elem.get('href')
-                    if href.startswith('/'):
-                        link = f"{self.base_url}{href}"
-                    elif href.startswith('http'):
-                        link = href
-                
-                # Extract summary
-                summary = ""
-                desc_elem = item.find(['p', 'div'], class_=re.compile(r'description|summary|excerpt', re.I))
-                if desc_elem:
-                    summary = desc_elem.get_text(strip=True)
-                
-                if not summary:
-                    # Try to get first paragraph
-                    first_p = item.find('p')
-                    if first_p:
-                        summary = first_p.get_text(strip=True)
-                
-                if not summary:
-                    summary = f"Latest news from RMIT University"
-                
-                # Clean up summary
-                summary = re.sub(r'\s+', ' ', summary)
-                if len(summary) > 200:
-                    summary = summary[:197] + "..."
-                
-                # Extract date - this is the key fix
-                date_text = self.extract_date_from_element(item)
-                days_ago = self.calculate_days_ago(date_text)
-                
-                # Detect category
-                detected_category = self.detect_category(title, summary, category)
-                
-                article_data = {
-                    "title": title,
-                    "link": link,
-                    "summary": summary,
-                    "published": (datetime.now() - timedelta(days=days_ago)).strftime("%a, %d %b %Y %H:%M:%S GMT"),
-                    "days_ago": days_ago,
-                    "category": detected_category,
-                    "source": "live_rmit"
-                }
-                
+        for item in candidates["news_items"]:
+            article_data = self.extract_from_news_item(item, category)
+            if article_data:
                 articles.append(article_data)
-                
-            except Exception as e:
-                continue
         
         return articles
     
+    def extract_from_news_item(self, item, category):
+        """Extract article data from a modern layout news item"""
+        try:
+            # Extract title
+            title_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5']) or item.find('a')
+            if not title_elem:
+                return None
+                
+            title = title_elem.get_text(strip=True)
+            if not title or len(title) < 10:
+                return None
+            
+            # Extract link
+            link = "#"
+            link_elem = item.find('a')
+            if link_elem and link_elem.get('href'):
+                href = link_elem.get('href')
+                if href.startswith('/'):
+                    link = f"{self.base_url}{href}"
+                elif href.startswith('http'):
+                    link = href
+            
+            # Extract summary
+            summary = ""
+            desc_elem = item.find(['p', 'div'], class_=re.compile(r'description|summary|excerpt', re.I))
+            if desc_elem:
+                summary = desc_elem.get_text(strip=True)
+            
+            if not summary:
+                # Try to get first paragraph
+                first_p = item.find('p')
+                if first_p:
+                    summary = first_p.get_text(strip=True)
+            
+            if not summary:
+                summary = f"Latest news from RMIT University"
+            
+            # Clean up summary
+            summary = re.sub(r'\s+', ' ', summary)
+            if len(summary) > 200:
+                summary = summary[:197] + "..."
+            
+            # Extract date - this is the key fix
+            date_text = self.extract_date_from_element(item)
+            published_at = self.published_at_for(date_text)
+            
+            # Detect category
+            detected_category = self.detect_category(title, summary, category)
+            
+            return {
+                "title": title,
+                "link": link,
+                "summary": summary,
+                "published": format_published(published_at) if published_at else "",
+                "published_at": published_at.isoformat() if published_at else None,
+                "category": detected_category,
+                "source": "live_rmit"
+            }
+            
+        except Exception as e:
+            return None
+    
     def extract_date_from_element(self, element):
         """Extract date text from HTML element using CSS selectors + regex fallbacks."""
         # Prefer CSS selectors; BeautifulSoup supports these via .select_one()
-        selectors = [
-            'time[datetime]', 'time', '.date', '.published',
-            '.timestamp', '.news-date', '.card-date', '[datetime]'
-        ]
-        for sel in selectors:
+        for sel in DATE_SELECTORS:
             node = element.select_one(sel)
             if node:
                 # Prefer machine-readable datetime
@@ -160,71 +756,49 @@ class RMITLiveScraper:
         # Regex fallback on all visible text
         text = element.get_text(" ", strip=True)
 
-        patterns = [
-            r'\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b',   # 5 Feb 2025
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},\s+\d{4}\b', # Feb 5, 2025
-            r'\b\d{1,2}/\d{1,2}/\d{4}\b',                                                     # 05/02/2025
-            r'\b\d{4}-\d{2}-\d{2}\b'                                                          # 2025-02-05
-        ]
-        for pat in patterns:
-            m = re.search(pat, text, re.IGNORECASE)
+        for pattern in DATE_TEXT_PATTERNS:
+            m = pattern.search(text)
             if m: 
                 return m.group(0)
 
         return None
 
+    def parse_published_date(self, date_text):
+        """Parse scraped date text into a datetime, or None if unrecognised"""
+        if not date_text:
+            return None
+        return parse_date_text(date_text)
     
+    def published_at_for(self, date_text):
+        """Timezone-aware publish time for scraped date text, or None if undated.
+
+        Listings usually carry only a day, which becomes midnight Melbourne
+        time. Undated items (often nav or pager links) stay undated, so they
+        sort last and fall outside time-bounded filters.
+        """
+        parsed = self.parse_published_date(date_text)
+        if parsed is None:
+            return None
+        return to_rmit_time(parsed)
+
     def calculate_days_ago(self, date_text):
         """Calculate how many days ago a date is; robust to multiple formats."""
-        if not date_text:
+        parsed = self.parse_published_date(date_text)
+        if parsed is None:
             return 0
-
-        s = date_text.strip()
-        # Remove ordinal suffixes (1st, 2nd, 3rd, 4th …)
-        s = re.sub(r'(\d{1,2})(st|nd|rd|th)', r'\1', s, flags=re.IGNORECASE)
-        s = s.replace('\xa0', ' ').replace('–', '-').strip()
-
-        fmts = [
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%d %b %Y',
-            '%d %B %Y',
-            '%b %d, %Y',
-            '%B %d, %Y',
-        ]
-        for fmt in fmts:
-            try:
-                parsed = datetime.strptime(s, fmt)
-                return max(0, (datetime.now() - parsed).days)
-            except ValueError:
-                pass
-
-        # Try ISO-like substring if present
-        m = re.search(r'(\d{4}-\d{2}-\d{2})', s)
-        if m:
-            try:
-                parsed = datetime.strptime(m.group(1), '%Y-%m-%d')
-                return max(0, (datetime.now() - parsed).days)
-            except Exception:
-                pass
-
-        return 0
+        # Count calendar days, as the listings only carry a day
+        return max(0, (rmit_today() - to_rmit_time(parsed).date()).days)
 
     
-    def scrape_news_cards(self, soup, category):
+    def scrape_news_cards(self, soup, category, candidates=None):
         """Look for news cards"""
         articles = []
-        card_selectors = [
-            '[data-component="card"]',
-            '.card',
-            '.news-card',
-            '.news-item',
-            '.listing-item'
-        ]
+        if candidates is None:
+            candidates = self.collect_candidates(soup)
         
-        for selector in card_selectors:
-            cards = soup.select(selector)
-            for card in cards[:8]:
+        for selector in CARD_SELECTORS:
+            cards = candidates["cards"][selector]
+            for card in cards:
                 article = self.extract_from_card(card, category)
                 if article:
                     articles.append(article)
@@ -232,21 +806,23 @@ class RMITLiveScraper:
                 break
         return articles
     
-    def scrape_article_tags(self, soup, category):
+    def scrape_article_tags(self, soup, category, candidates=None):
         """Look for article tags"""
         articles = []
-        articles_html = soup.find_all('article')
-        for article_html in articles_html[:8]:
+        if candidates is None:
+            candidates = self.collect_candidates(soup)
+        for article_html in candidates["articles"]:
             article = self.extract_from_card(article_html, category)
             if article:
                 articles.append(article)
         return articles
     
-    def scrape_news_links(self, soup, category):
+    def scrape_news_links(self, soup, category, candidates=None):
         """Look for news links"""
         articles = []
-        news_links = soup.find_all('a', href=re.compile(r'/news/'))
-        for link in news_links[:12]:
+        if candidates is None:
+            candidates = self.collect_candidates(soup)
+        for link in candidates["links"]:
             article = self.extract_from_link(link, category)
             if article:
                 articles.append(article)
@@ -308,7 +884,7 @@ class RMITLiveScraper:
             
             # Extract date
             date_text = self.extract_date_from_element(card)
-            days_ago = self.calculate_days_ago(date_text)
+            published_at = self.published_at_for(date_text)
             
             # Detect category
             detected_category = self.detect_category(title, summary, category)
@@ -317,8 +893,8 @@ class RMITLiveScraper:
                 "title": title,
                 "link": link,
                 "summary": summary,
-                "published": (datetime.now() - timedelta(days=days_ago)).strftime("%a, %d %b %Y %H:%M:%S GMT"),
-                "days_ago": days_ago,
+                "published": format_published(published_at) if published_at else "",
+                "published_at": published_at.isoformat() if published_at else None,
                 "category": detected_category,
                 "source": "live_rmit"
             }
@@ -343,9 +919,14 @@ class RMITLiveScraper:
             
             summary = f"Recent {category} news from RMIT University"
             
-            # Try to extract date from parent element
-            date_text = self.extract_date_from_element(link_elem.parent)
-            days_ago = self.calculate_days_ago(date_text)
+            # Try to extract date from parent element; a partially parsed
+            # page hangs links straight off the document, whose dates
+            # belong to other articles
+            parent = link_elem.parent
+            if parent is None or isinstance(parent, BeautifulSoup):
+                parent = link_elem
+            date_text = self.extract_date_from_element(parent)
+            published_at = self.published_at_for(date_text)
             
             detected_category = self.detect_category(title, summary, category)
             
@@ -353,8 +934,8 @@ class RMITLiveScraper:
                 "title": title,
                 "link": link,
                 "summary": summary,
-                "published": (datetime.now() - timedelta(days=days_ago)).strftime("%a, %d %b %Y %H:%M:%S GMT"),
-                "days_ago": days_ago,
+                "published": format_published(published_at) if published_at else "",
+                "published_at": published_at.isoformat() if published_at else None,
                 "category": detected_category,
                 "source": "live_rmit"
             }
@@ -389,23 +970,54 @@ class RMITLiveScraper:
         return map_ui.get(str(original_category).lower(), 'All News')
 
     
-    def fetch_all_news(self):
-        """Fetch news from both categories"""
+    def fetch_category(self, category):
+        """Fetch one category, never raising so a pool worker can't fail the batch"""
+        try:
+            print(f"🔄 Fetching {category} news...")
+            return self.scrape_rmit_news(category)
+        except Exception as e:
+            print(f"❌ Failed to fetch {category}: {e}")
+            self.listing_status.setdefault(category, str(e))
+            return []
+
+    def listings_fetched(self):
+        """True if the last fetch_all_news got at least one listing (200 or 304)"""
+        return any(error is None for error in self.listing_status.values())
+
+    def listing_errors(self):
+        """{category: error} for listings the last fetch_all_news could not get"""
+        return {category: error for category, error in self.listing_status.items() if error is not None}
+
+    def fetch_all_news(self, known_links=None):
+        """Fetch news from both categories.
+
+        With `known_links` (normalised links already stored) the fetch is
+        incremental: listing walks stop at runs of known links and only new
+        articles are returned.
+        """
         all_articles = []
         categories = ["all_news", "technology", "science"]
+        incremental = known_links is not None
+        self.known_links = {link for link in (known_links or ()) if link and link != '#'}
+        self.listing_status = {}
         
-        for category in categories:
-            try:
-                print(f"🔄 Fetching {category} news...")
-                articles = self.scrape_rmit_news(category)
-                all_articles.extend(articles)
-                time.sleep(2)  # Be respectful to the server
-            except Exception as e:
-                print(f"❌ Failed to fetch {category}: {e}")
-                continue
+        try:
+            if self.concurrent:
+                # Results come back in category order, so de-duplication below
+                # keeps the same article as the sequential path would.
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    for articles in pool.map(self.fetch_category, categories):
+                        all_articles.extend(articles)
+            else:
+                for category in categories:
+                    all_articles.extend(self.fetch_category(category))
+        finally:
+            known = self.known_links
+            self.known_links = set()
         
-        # Remove duplicates (use title + link as a stable key)
-        seen = set()
+        # Remove duplicates (use title + link as a stable key); known links
+        # also drops articles replayed from a 304 response
+        seen = set(known)
         unique_articles = []
 
         for article in all_articles:
@@ -417,12 +1029,14 @@ class RMITLiveScraper:
         print(f"📊 Total unique articles collected: {len(unique_articles)}")
 
         # If we have very few articles, try one more strategy
-        # Fallback: scrape /news for extra links if we found very few
-        if len(unique_articles) < 3:
+        # Fallback: scrape /news for extra links if we found very few.
+        # A quiet incremental refresh legitimately finds almost nothing.
+        if len(unique_articles) < 3 and not incremental:
             try:
-                resp = requests.get("https://www.rmit.edu.au/news", timeout=15)
-                soup = BeautifulSoup(resp.content, "html.parser")
-                news_links = soup.find_all('a', href=re.compile(r'/news/'))
+                self.rate_limiter.acquire("https://www.rmit.edu.au/news")
+                resp = self.session.get("https://www.rmit.edu.au/news", timeout=15)
+                soup = make_soup(resp.content, self.parser_backend)
+                news_links = soup.find_all('a', href=NEWS_LINK_RE)
                 for link in news_links[:10]:
                     extra = self.extract_from_link(link, "all_news")
                     if not extra:
@@ -434,43 +1048,1035 @@ class RMITLiveScraper:
             except Exception as e:
                 print(f"Alternative approach failed: {e}")
 
-        return unique_articles[:15]
+        return unique_articles
+
+    def crawl_listing_page(self, url, category, since=None):
+        """Fetch and parse one listing page for a backfill crawl.
+
+        Returns (articles, next page URLs, reached_horizon); see
+        split_at_horizon for how `since` applies.
+        """
+        content, next_urls = self.fetch_listing_page(url, category)
+        articles, found = self.parse_listing_page(content, category, url)
+        next_urls += [u for u in found if u not in next_urls]
+        articles, reached_horizon = split_at_horizon(articles, since)
+        return articles, next_urls, reached_horizon
+
+    def fetch_listing_page(self, url, category=None):
+        """GET (and archive) a listing page; returns (HTML content, next page URLs)"""
+        self.rate_limiter.acquire(url)
+        response = self.session.get(url, timeout=15)
+        response.raise_for_status()
+        self.archive_response(url, response, category)
+        return listing_html(response.content, response.headers.get('Content-Type', ''), url)
+
+    def archive_response(self, url, response, category):
+        """Keep the raw body for offline re-extraction, if archiving is on"""
+        if self.archive is None:
+            return
+        try:
+            self.archive.put(url, response.content, response.headers, category)
+        except Exception as e:
+            print(f"❌ Error archiving {url}: {e}")
+
+    def parse_listing_page(self, content, category, url):
+        """Every article and further-page URL on a listing page's HTML"""
+        soup = make_soup(content, self.parser_backend)
+        articles = self.scrape_with_multiple_strategies(soup, category, enough=None)
+        next_urls = find_next_pages(soup, url)
+
+        # "Next page" links are not articles (section and pager links are
+        # already dropped by the strategies)
+        listing_links = {normalise_link(u) for u in next_urls}
+        articles = [a for a in articles if normalise_link(a.get('link')) not in listing_links]
+        return articles, next_urls
+
+    def fetch_page_metadata(self, link, known_hash=None, validators=None):
+        """Fetch an article page; returns (content hash, metadata or None if unchanged, validators).
+
+        With the page's stored `validators` ("etag", "last_modified") the
+        request is conditional, so an unchanged page costs a 304 and no body;
+        a changed body with the same hash is not parsed again.
+        """
+        validators = validators or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        self.rate_limiter.acquire(link)
+        response = self.session.get(link, headers=headers, timeout=15)
+        if response.status_code == 304 and known_hash:
+            return known_hash, None, validators
+        response.raise_for_status()
+        validators = {"etag": response.headers.get("ETag"),
+                      "last_modified": response.headers.get("Last-Modified")}
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if content_hash == known_hash:
+            return content_hash, None, validators
+        return content_hash, extract_page_metadata(response.content, self.parser_backend), validators
+
+    def apply_page_metadata(self, article, metadata):
+        """Copy of `article` with the page's summary, date and category filled in"""
+        enriched = dict(article)
+        if metadata.get("summary"):
+            enriched["summary"] = clean_summary(metadata["summary"])
+        parsed = parse_date_text(metadata["published"]) if metadata.get("published") else None
+        if parsed is not None:
+            published_at = to_rmit_time(parsed)
+            enriched["published"] = format_published(published_at)
+            enriched["published_at"] = published_at.isoformat()
+        section = metadata.get("section") or article.get("category", "all_news")
+        enriched["category"] = self.detect_category(enriched["title"], enriched["summary"], section)
+        return enriched
+
+    def enrich_articles(self, articles, known_pages=None):
+        """Fill in link-only articles from their own pages, a few at a time.
+
+        `known_pages` maps normalised links to (content hash, metadata,
+        validators) from earlier runs; a page that answers 304 or whose hash
+        is unchanged reuses that metadata instead of being parsed again.
+        Returns (articles, pages) where pages holds the (hash, metadata,
+        validators) of every page fetched this run.
+        """
+        known_pages = known_pages or {}
+        targets = [
+            article for article in articles
+            if needs_enrichment(article) and article.get('link', '#').startswith('http')
+            and not is_section_url(article['link']) and not is_listing_url(article['link'])
+        ][:self.enrich_limit]
+        if not targets:
+            return articles, {}
+
+        def fetch(article):
+            key = normalise_link(article['link'])
+            known_hash, known_metadata, validators = known_pages.get(key, (None, None, None))
+            try:
+                content_hash, metadata, validators = self.fetch_page_metadata(
+                    article['link'], known_hash, validators
+                )
+            except Exception as e:
+                print(f"❌ Error enriching {article['link']}: {e}")
+                return key, None
+            return key, (content_hash, known_metadata if metadata is None else metadata, validators)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pages = dict(page for page in pool.map(fetch, targets) if page[1] is not None)
+
+        enriched = []
+        for article in articles:
+            page = pages.get(normalise_link(article.get('link')))
+            if page and page[1] and needs_enrichment(article):
+                article = self.apply_page_metadata(article, page[1])
+            enriched.append(article)
+        print(f"🔍 Enriched {len(pages)} of {len(targets)} link-only articles from their pages")
+        return enriched, pages
 
 # Cache functions
+CACHE_FILE = "news_cache.json"
+# Recency is computed at render time, so cached articles never go stale
+# on their own; refreshes only need to pick up newly published stories
+CACHE_TTL_SECONDS = 4 * 3600
+# Per-category expiry (UI labels); categories not listed use CACHE_TTL_SECONDS
+CATEGORY_TTL_SECONDS = {
+    "All News": 4 * 3600,
+    "Technology": 4 * 3600,
+    "Science": 4 * 3600,
+}
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_article_store():
+    """Process-wide SQLite article store, seeded from a legacy JSON cache once"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = article_store.ArticleStore()
+            if _store.count() == 0 and os.path.exists(CACHE_FILE):
+                try:
+                    with open(CACHE_FILE, "r", encoding="utf-8") as f:
+                        legacy = json.load(f)
+                    _store.upsert(legacy.get("articles", []))
+                    _store.set_meta("last_updated", legacy.get("last_updated"))
+                    print(f"📦 Imported {CACHE_FILE} into the article store")
+                except Exception as e:
+                    print(f"❌ Error importing legacy cache: {e}")
+        return _store
+
+
+# UI time period filters as a maximum age in days (None = no limit)
+TIME_PERIOD_DAYS = {
+    "All Time": None,
+    "Last 7 Days": 7,
+    "Last 30 Days": 30,
+    "Last 3 Months": 90,
+}
+
+
+# Category labels used by detect_category and the UI filters
+CATEGORY_LABELS = ("All News", "Technology", "Science")
+_CATEGORY_BY_KEY = {sys.intern(label).lower(): sys.intern(label) for label in CATEGORY_LABELS}
+
+
+def intern_category(category):
+    """Canonical, interned category label ("science" -> "Science")"""
+    category = category or "All News"
+    return _CATEGORY_BY_KEY.get(category.lower()) or sys.intern(category)
+
+
+class Article:
+    """Immutable, slotted article record.
+
+    Category and source are interned, so a long archive stores each label
+    once; `published` is rendered from `published_at` on demand. `get`
+    mirrors dict access so the UI and prompt code take records or dicts.
+    """
+
+    __slots__ = ("title", "link", "summary", "published_at", "category", "source", "days_ago")
+
+    FIELDS = ("title", "link", "summary", "published", "published_at", "category", "source")
+
+    def __init__(self, title, link, summary, published_at, category, source, days_ago=None):
+        set_field = object.__setattr__
+        set_field(self, "title", title)
+        set_field(self, "link", link)
+        set_field(self, "summary", summary)
+        set_field(self, "published_at", published_at)
+        set_field(self, "category", intern_category(category))
+        set_field(self, "source", sys.intern(source or ""))
+        # Only legacy articles without a timestamp carry a frozen day count
+        set_field(self, "days_ago", days_ago)
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, cls):
+            return data
+        published_at = data.get("published_at") or None
+        return cls(
+            data.get("title", ""),
+            data.get("link", ""),
+            data.get("summary", ""),
+            published_at,
+            data.get("category"),
+            data.get("source"),
+            None if published_at else data.get("days_ago"),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Article records are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Article records are immutable")
+
+    @property
+    def published(self):
+        published_at = article_published_at(self)
+        return format_published(published_at) if published_at else ""
+
+    def get(self, key, default=None):
+        if key in self.__slots__ or key == "published":
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+
+    def to_dict(self):
+        data = {field: self.get(field) for field in self.FIELDS}
+        if self.days_ago is not None:
+            data["days_ago"] = self.days_ago
+        return data
+
+    def __eq__(self, other):
+        if not isinstance(other, Article):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.link, self.title, self.published_at))
+
+    def __repr__(self):
+        return f"Article({self.title!r}, {self.category!r}, {self.published_at!r})"
+
+
+def build_article_frame(articles):
+    """Columnar view of the articles, or None when pandas is not installed.
+
+    Row labels are positions in `articles`; category and source are
+    categoricals so a long history costs one small code per row. Columns
+    are read straight off the records, and the UTC timestamps the store
+    writes are parsed in one vectorised pass.
+    """
+    if pd is None:
+        return None
+    records = [a if isinstance(a, Article) else Article.from_dict(a) for a in articles]
+    frame = pd.DataFrame({
+        "title": [a.title for a in records],
+        "link": [a.link for a in records],
+        "summary": [a.summary for a in records],
+        "category": pd.Categorical([a.category for a in records]),
+        "source": pd.Categorical([a.source for a in records]),
+    })
+    stored = [a.published_at if a.published_at and a.published_at.endswith("+00:00") else None
+              for a in records]
+    published_ts = pd.to_datetime(pd.Series(stored, dtype=object), utc=True, format="ISO8601")
+    # Local or legacy (days_ago only) timestamps take the slow, exact route
+    others = [i for i, value in enumerate(stored) if value is None]
+    if others:
+        published = [article_published_at(records[i]) for i in others]
+        published_ts.iloc[others] = pd.to_datetime(
+            [p.astimezone(timezone.utc) if p else None for p in published], utc=True
+        )
+    frame["published_ts"] = published_ts.dt.tz_localize(None)
+    # Publish day in Melbourne, so day differences match article_days_ago
+    frame["published_day"] = published_ts.dt.tz_convert(RMIT_TZ).dt.tz_localize(None).dt.normalize()
+    frame["category_key"] = frame["category"].str.lower().astype("category")
+    return frame
+
+
+# Below this many articles the plain list scan builds a FilterIndex faster
+# than building a frame first (see scraper_bench.py --filter-index)
+FRAME_MIN_ARTICLES = 2500
+
+
+class FilterIndex:
+    """Filtered article lists and counts for every (category, time period) pair.
+
+    Built once per snapshot and day; lists are tuples sorted newest first,
+    so the preview and headline slices are cheap views instead of fresh
+    scans. With an article frame the masks are computed column-wise, counts
+    come straight from them and each list is only materialised when read.
+    """
+
+    def __init__(self, articles, frame=None, today=None):
+        self.today = today or rmit_today()
+        self._lists = {}
+        # Frame-built lists are kept as row positions until first asked for
+        self._positions = {}
+        self._articles = articles
+        if frame is not None:
+            self._build_from_frame(articles, frame)
+            return
+        published = {id(a): article_published_at(a) for a in articles}
+        ordered = sorted(
+            articles,
+            key=lambda a: -published[id(a)].timestamp() if published[id(a)] else float('inf'),
+        )
+        categories = {a.get('category', 'All News') for a in ordered}
+        for period, max_days in TIME_PERIOD_DAYS.items():
+            if max_days is None:
+                in_period = tuple(ordered)
+            else:
+                in_period = tuple(
+                    a for a in ordered
+                    if published[id(a)] and max(0, (self.today - published[id(a)].date()).days) <= max_days
+                )
+            self._lists[("all news", period)] = in_period
+            for category in categories:
+                key = category.lower()
+                if key != "all news":
+                    self._lists[(key, period)] = tuple(
+                        a for a in in_period if a.get('category', 'All News').lower() == key
+                    )
+
+    def _build_from_frame(self, articles, frame):
+        ordered = frame.sort_values("published_ts", ascending=False, kind="stable", na_position="last")
+        positions = ordered.index.to_numpy()
+        days_ago = (pd.Timestamp(self.today) - ordered["published_day"]).dt.days
+        days_ago = days_ago.clip(lower=0).fillna(999).to_numpy()
+        category_keys = ordered["category_key"]
+        for period, max_days in TIME_PERIOD_DAYS.items():
+            if max_days is None:
+                in_period = np.ones(len(days_ago), dtype=bool)
+            else:
+                in_period = days_ago <= max_days
+            self._positions[("all news", period)] = positions[in_period]
+            for key in category_keys.cat.categories:
+                if key != "all news":
+                    mask = in_period & (category_keys == key).to_numpy()
+                    self._positions[(key, period)] = positions[mask]
+
+    def articles(self, category="All News", period="All Time"):
+        key = (category.lower(), period)
+        found = self._lists.get(key)
+        if found is None:
+            positions = self._positions.get(key)
+            if positions is None:
+                return ()
+            found = self._lists[key] = tuple(self._articles[i] for i in positions)
+        return found
+
+    def count(self, category="All News", period="All Time"):
+        key = (category.lower(), period)
+        if key in self._positions:
+            return len(self._positions[key])
+        return len(self._lists.get(key, ()))
+
+
+class ArticleSnapshot:
+    """Immutable, versioned article list shared by every session in the process.
+
+    Articles are immutable Article records, so sessions can hold a reference
+    without copying; a refresh publishes a new snapshot with a higher version.
+    `load_history` returns the full stored history, which the filter index
+    covers; without it the index covers `articles`.
+    """
+
+    __slots__ = ("articles", "version", "last_updated", "_filter_index", "_frame",
+                 "_history", "_load_history")
+
+    def __init__(self, articles, version, last_updated=None, load_history=None):
+        self.articles = tuple(Article.from_dict(a) for a in articles)
+        self.version = version
+        self.last_updated = last_updated
+        self._filter_index = None
+        self._frame = None
+        self._history = None
+        self._load_history = load_history
+
+    def __len__(self):
+        return len(self.articles)
+
+    @property
+    def tag(self):
+        """Version plus refresh time; unlike the version alone, unique across restarts"""
+        if self.last_updated is None:
+            return str(self.version)
+        return f"{self.version}@{self.last_updated.isoformat()}"
+
+    @property
+    def history(self):
+        """Every stored article as records, newest first, loaded on first use"""
+        if self._history is None:
+            if self._load_history is None:
+                self._history = self.articles
+            else:
+                self._history = tuple(Article.from_dict(a) for a in self._load_history())
+        return self._history
+
+    @property
+    def frame(self):
+        """pandas frame over this snapshot's history (None without pandas), built on first use"""
+        if self._frame is None and self.history:
+            self._frame = build_article_frame(self.history)
+        return self._frame
+
+    @property
+    def filter_index(self):
+        """FilterIndex over this snapshot's history for today, built on first use each day"""
+        today = rmit_today()
+        index = self._filter_index
+        if index is None or index.today != today:
+            history = self.history
+            frame = self.frame if len(history) >= FRAME_MIN_ARTICLES else None
+            index = FilterIndex(history, frame, today)
+            self._filter_index = index
+        return index
+
+
+class NewsCache:
+    """Two-tier article cache: a process-wide memory tier over the article store.
+
+    The memory tier holds one article list per category together with the
+    refresh time it was read at, so every Streamlit session in the process
+    shares a single disk read. Freshness is judged against the time of the
+    last scrape, with a TTL per category.
+    """
+
+    def __init__(self, ttl=CACHE_TTL_SECONDS, category_ttl=None):
+        self.ttl = ttl
+        self.category_ttl = dict(CATEGORY_TTL_SECONDS if category_ttl is None else category_ttl)
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self.version = 0
+        self._memory = {}
+        self._snapshot = None
+        self._search_index = None
+        self._lock = threading.Lock()
+        # Seeding the search index reads the whole store, so it has its own
+        # lock rather than holding up get()/snapshot() readers
+        self._search_lock = threading.Lock()
+
+    def ttl_for(self, category):
+        return self.category_ttl.get(category, self.ttl)
+
+    def _read_disk(self, category):
+        store = get_article_store()
+        last_updated = store.get_meta("last_updated")
+        if not last_updated:
+            return None
+        articles = store.query(category=category, limit=MAX_CACHED_ARTICLES)
+        return datetime.fromisoformat(last_updated), articles
+
+    def _is_fresh(self, category, last_updated):
+        age = (datetime.now() - last_updated).total_seconds()
+        return age < self.ttl_for(category)
+
+    def get(self, category="All News", allow_stale=False):
+        """Cached articles for a category, or None if missing or expired"""
+        with self._lock:
+            entry = self._memory.get(category)
+            if entry is not None and (allow_stale or self._is_fresh(category, entry[0])):
+                self.stats["memory_hits"] += 1
+                return entry[1]
+
+            try:
+                entry = self._read_disk(category)
+            except Exception as e:
+                print(f"❌ Error loading cache: {e}")
+                entry = None
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._memory[category] = entry
+            if allow_stale or self._is_fresh(category, entry[0]):
+                self.stats["disk_hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, articles):
+        """Write articles through to the store and reset the memory tier"""
+        store = get_article_store()
+        store.upsert(articles, is_placeholder=needs_enrichment)
+        with self._search_lock:
+            if self._search_index is not None:
+                # Index what was stored, which may have kept an enriched summary
+                for article in store.get_articles([a.get('link') for a in articles]):
+                    index_article(self._search_index, article)
+        now = datetime.now()
+        store.set_meta("last_updated", now.isoformat())
+        recent = store.query(limit=MAX_CACHED_ARTICLES)
+        with self._lock:
+            # Replace the whole tier so readers never see a mix of refreshes
+            self._memory = {"All News": (now, recent)}
+            self.version += 1
+
+    def snapshot(self):
+        """Current ArticleSnapshot, rebuilt only after a new refresh is stored"""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.version:
+            return snapshot
+        version = self.version
+        articles = self.get(allow_stale=True) or []
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != self.version:
+                entry = self._memory.get("All News")
+                snapshot = ArticleSnapshot(articles, version, entry[0] if entry else None,
+                                           load_history=get_article_store().query)
+                if version == self.version:
+                    self._snapshot = snapshot
+                return snapshot
+            return self._snapshot
+
+    def last_updated(self, category="All News"):
+        with self._lock:
+            entry = self._memory.get(category)
+        if entry is None:
+            self.get(category, allow_stale=True)
+            with self._lock:
+                entry = self._memory.get(category)
+        return entry[0] if entry else None
+
+    def age_seconds(self, category="All News"):
+        last_updated = self.last_updated(category)
+        if last_updated is None:
+            return None
+        return (datetime.now() - last_updated).total_seconds()
+
+    def is_stale(self, category="All News"):
+        age = self.age_seconds(category)
+        return age is None or age >= self.ttl_for(category)
+
+    def search_index(self):
+        """BM25 index over the stored history, seeded once and then fed by put()"""
+        index = self._search_index
+        if index is not None:
+            return index
+        with self._search_lock:
+            # put() feeds the index under the same lock, so nothing stored
+            # while we seed is missed
+            if self._search_index is None:
+                index = news_search.BM25Index()
+                for article in get_article_store().query():
+                    index_article(index, article)
+                self._search_index = index
+            return self._search_index
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory = {}
+
+
+_news_cache = None
+
+def get_news_cache():
+    """Process-wide two-tier cache shared by every Streamlit session"""
+    global _news_cache
+    with _store_lock:
+        if _news_cache is None:
+            _news_cache = NewsCache()
+        return _news_cache
+
 def save_news_cache(articles):
     try:
-        with open("news_cache.json", "w", encoding="utf-8") as f:
-            json.dump({
-                "articles": articles,
-                "last_updated": datetime.now().isoformat(),
-                "source": "enhanced_rmit_scraper",
-                "total_articles": len(articles)
-            }, f, indent=2, ensure_ascii=False)
+        get_news_cache().put(articles)
         print("💾 News cache saved successfully")
     except Exception as e:
         print(f"❌ Error saving cache: {e}")
 
-def load_news_cache():
+def read_news_cache():
+    """Most recent stored articles and the last refresh time, regardless of age, or None"""
+    cache = get_news_cache()
+    articles = cache.get(allow_stale=True)
+    if articles is None:
+        return None
+    return {
+        "articles": articles,
+        "last_updated": cache.last_updated().isoformat(),
+        "source": "enhanced_rmit_scraper",
+        "total_articles": len(articles)
+    }
+
+def load_news_cache(category="All News"):
+    """Fresh cached articles for a category, or None once its TTL has passed"""
+    articles = get_news_cache().get(category)
+    if articles is not None:
+        print("📁 Using cached news data")
+    return articles
+
+def cache_stats():
+    """Hit/miss counters for the memory and disk tiers"""
+    return dict(get_news_cache().stats)
+
+def index_article(index, article):
+    """Add (or replace) one article in a BM25Index"""
+    key = normalise_link(article.get('link'))
+    if not key or key == '#':
+        return
+    published_at = article_published_at(article)
+    index.add(
+        key,
+        article.get('title', ''),
+        article.get('summary', ''),
+        article.get('category', 'All News'),
+        published_at.timestamp() if published_at else None,
+    )
+
+def published_since_for(max_days):
+    """Start of the Melbourne day `max_days` ago, matching article_days_ago"""
+    if max_days is None:
+        return None
+    first_day = rmit_today() - timedelta(days=max_days)
+    return datetime.combine(first_day, datetime.min.time(), tzinfo=RMIT_TZ)
+
+def rank_articles(question, candidates, category=None, max_days=None, k=8):
+    """The k candidates most relevant to `question` by BM25, best first.
+
+    Searches the whole stored history within the category/time filters and
+    keeps hits that are among `candidates`; if fewer than k match (generic
+    questions, demo data) the rest are filled with candidates in order.
+    """
+    since = published_since_for(max_days)
     try:
-        if os.path.exists("news_cache.json"):
-            with open("news_cache.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-                last_updated = datetime.fromisoformat(data["last_updated"])
-                if (datetime.now() - last_updated).seconds < 3600:
-                    print("📁 Using cached news data")
-                    return data["articles"]
+        hits = get_news_cache().search_index().search(
+            question, k, category, since.timestamp() if since else None
+        )
     except Exception as e:
-        print(f"❌ Error loading cache: {e}")
-    return None
+        print(f"❌ Error ranking articles: {e}")
+        hits = []
+    by_link = {}
+    for article in candidates:
+        by_link.setdefault(normalise_link(article.get('link')), article)
+    ranked = [by_link[key] for key, _ in hits if key in by_link]
+    if len(ranked) < k:
+        chosen = {id(a) for a in ranked}
+        ranked += [a for a in candidates if id(a) not in chosen][:k - len(ranked)]
+    return ranked
+
+def load_known_links(articles=None):
+    """Normalised links of every stored article (or of `articles` if given)"""
+    if articles is None:
+        return get_article_store().known_links()
+    return {normalise_link(a.get('link')) for a in articles if a.get('link')}
+
+def query_articles(category=None, max_days=None, limit=None):
+    """Stored articles newest first, filtered by category and age in days via the store indexes"""
+    published_since = published_since_for(max_days)
+    try:
+        return get_article_store().query(category=category, published_since=published_since, limit=limit)
+    except Exception as e:
+        print(f"❌ Error querying articles: {e}")
+        return []
+
+_scraper = None
+_scraper_lock = threading.Lock()
+_archive = None
+_archive_lock = threading.Lock()
+
+def get_page_archive():
+    """Process-wide raw page archive"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = page_archive.PageArchive()
+        return _archive
+
+def get_scraper():
+    """Process-wide scraper, so the pooled session and ETags survive refreshes"""
+    global _scraper
+    with _scraper_lock:
+        if _scraper is None:
+            _scraper = RMITLiveScraper(enrich_details=True, archive=get_page_archive())
+        return _scraper
+
+class ListingFetchError(Exception):
+    """Every RMIT listing request failed"""
+
+def scrape_latest_news():
+    """Scrape RMIT (incrementally when we have a corpus) into the store.
+
+    Returns the most recent stored articles. Raises ListingFetchError, without touching the cache, when no listing
+    could be fetched at all, so an outage never looks like a fresh refresh.
+    """
+    print("🌐 Fetching LIVE news from RMIT website")
+    scraper = get_scraper()
+    store = get_article_store()
+    incremental = store.count() >= 3
+    # Only walk listings until we hit articles we already have
+    articles = scraper.fetch_all_news(known_links=load_known_links() if incremental else None)
+    if not scraper.listings_fetched():
+        errors = "; ".join(f"{category}: {error}" for category, error in scraper.listing_errors().items())
+        raise ListingFetchError(f"No RMIT listing could be fetched ({errors or 'no listings'})")
+    if incremental:
+        print(f"🆕 {len(articles)} new articles since last refresh")
+    elif not articles:
+        return []
+    save_news_cache(enrich_articles(scraper, articles))
+    return read_news_cache()["articles"]
+
+def enrich_articles(scraper, articles):
+    """Run the scraper's detail enrichment, if enabled, with page hashes from the store.
+
+    Incremental refreshes only return new links, so spare enrichment slots
+    go to stored articles still on a placeholder summary whose page was not
+    checked in the last ENRICH_RECHECK_SECONDS; the ones that get filled in
+    are returned with `articles` to be saved.
+    """
+    if not scraper.enrich_details:
+        return articles
+    try:
+        store = get_article_store()
+        pending = [a for a in articles if needs_enrichment(a)]
+        stored = []
+        room = scraper.enrich_limit - len(pending)
+        if room > 0:
+            seen = {normalise_link(a.get('link')) for a in articles}
+            checked_before = datetime.now() - timedelta(seconds=ENRICH_RECHECK_SECONDS)
+            stored = [
+                a for a in store.placeholder_articles(room, checked_before)
+                if needs_enrichment(a) and normalise_link(a.get('link')) not in seen
+            ]
+        links = [normalise_link(a.get('link')) for a in pending + stored]
+        enriched, pages = scraper.enrich_articles(list(articles) + stored, store.get_pages(links))
+        store.save_pages(pages)
+        refilled = [a for a in enriched[len(articles):] if not needs_enrichment(a)]
+        if refilled:
+            print(f"🩹 Filled in {len(refilled)} stored placeholder articles")
+        return enriched[:len(articles)] + refilled
+    except Exception as e:
+        print(f"❌ Error enriching articles: {e}")
+    return articles
+
+
+# Backfill crawl defaults: how many pagination hops to follow from each listing
+BACKFILL_MAX_DEPTH = 50
+
+
+# Compact records parse workers send back instead of article dicts;
+# `published` is rebuilt from `published_at` in the parent
+ROW_FIELDS = ("title", "link", "summary", "published_at", "category", "source")
+WARMUP_PAGE = b"""<html><body><div class="news-card" data-component="card">
+<a href="/news/all-news/2025/jan/warm-up"><h3>Parse worker warm-up article</h3></a>
+<p class="description">Research from the lab.</p><time datetime="2025-01-02">2 January 2025</time>
+</div><a rel="next" href="/news/all-news?page=2">Next</a></body></html>"""
+
+
+def article_row(article):
+    return tuple(article.get(field) for field in ROW_FIELDS)
+
+
+def article_from_row(row):
+    article = dict(zip(ROW_FIELDS, row))
+    published_at = article_published_at(article)
+    article["published"] = format_published(published_at) if published_at else ""
+    return article
+
+
+_worker_scraper = None
+
+
+def init_parse_worker(parser_backend=None):
+    """Parse worker initializer: build the scraper and warm it up, once per process"""
+    global _worker_scraper
+    _worker_scraper = RMITLiveScraper(concurrent=False, parser_backend=parser_backend)
+    # The first parse imports the tree builder and fills the regex and
+    # strptime caches; pay for it here rather than on a real page
+    _worker_scraper.parse_listing_page(WARMUP_PAGE, "all_news", _worker_scraper.news_urls["all_news"])
+
+
+def parse_listing_task(task):
+    """Parse worker entry point: (content, category, url) -> (article rows, next URLs)"""
+    content, category, url = task
+    articles, next_urls = _worker_scraper.parse_listing_page(content, category, url)
+    return [article_row(a) for a in articles], next_urls
+
+
+class ParsePool:
+    """Process pool that parses listing HTML off the GIL.
+
+    Parsing and extraction are pure Python, so threads cannot spread them
+    over cores; worker processes each hold a warmed-up scraper and send
+    back compact article rows rather than dicts.
+    """
+
+    def __init__(self, workers=None, parser_backend=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_parse_worker,
+            initargs=(select_parser_backend(parser_backend),),
+        )
+
+    def parse(self, pages, chunksize=1):
+        """(articles, next URLs) for each (content, category, url) page, in order"""
+        for rows, next_urls in self._pool.map(parse_listing_task, pages, chunksize=chunksize):
+            yield [article_from_row(row) for row in rows], next_urls
+
+    def close(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def backfill_archive(max_depth=BACKFILL_MAX_DEPTH, horizon_days=None, max_pages=None,
+                     scraper=None, restart=False, parse_workers=0):
+    """Crawl listing pagination into the article store, resumably.
+
+    The frontier of listing pages lives in the store: an interrupted run
+    picks up where it stopped, and `restart` crawls again from the seed
+    listings. Pagination is followed up to `max_depth` hops, and not past
+    pages with articles older than `horizon_days`. Throughput is set by the
+    scraper's max_workers and rate limit; with `parse_workers` the fetched
+    pages are parsed in a ParsePool of that many processes. Returns crawl
+    counters.
+    """
+    # A dedicated scraper by default, so a crawl never shares incremental
+    # fetch state with the app's refresher
+    scraper = scraper or RMITLiveScraper(max_workers=4, archive=get_page_archive())
+    store = get_article_store()
+    if restart:
+        store.reset_frontier()
+    since = published_since_for(horizon_days)
+    store.enqueue_frontier((url, category, 0) for category, url in scraper.news_urls.items())
+
+    parse_pool = ParsePool(parse_workers, scraper.parser_backend) if parse_workers else None
+
+    def crawl(entry):
+        url, category, depth = entry
+        try:
+            if parse_pool is not None:
+                # Fetch only; parsing happens in the process pool
+                return scraper.fetch_listing_page(url, category)
+            return scraper.crawl_listing_page(url, category, since)
+        except Exception as e:
+            print(f"❌ Error crawling {url}: {e}")
+            return None
+
+    def parse_batch(batch, fetched):
+        pages = [(page[0], entry[1], entry[0]) for entry, page in zip(batch, fetched) if page]
+        parsed = iter(parse_pool.parse(pages))
+        results = []
+        for page in fetched:
+            if not page:
+                results.append(None)
+                continue
+            articles, found = next(parsed)
+            articles, reached_horizon = split_at_horizon(articles, since)
+            results.append((articles, page[1] + [u for u in found if u not in page[1]], reached_horizon))
+        return results
+
+    stats = {"pages": 0, "failed": 0, "articles": 0, "queued": 0}
+    batch_size = max(scraper.max_workers, parse_workers) * 2
+    pool = ThreadPoolExecutor(max_workers=scraper.max_workers)
+    try:
+        while max_pages is None or stats["pages"] < max_pages:
+            limit = batch_size
+            if max_pages is not None:
+                limit = min(limit, max_pages - stats["pages"])
+            batch = store.next_frontier(limit)
+            if not batch:
+                break
+            results = list(pool.map(crawl, batch))
+            if parse_pool is not None:
+                results = parse_batch(batch, results)
+            for (url, category, depth), result in zip(batch, results):
+                if result is None:
+                    store.mark_frontier(url, ok=False)
+                    stats["failed"] += 1
+                    continue
+                articles, next_urls, reached_horizon = result
+                if articles:
+                    save_news_cache(articles)
+                    stats["articles"] += len(articles)
+                if depth < max_depth and not reached_horizon:
+                    stats["queued"] += store.enqueue_frontier((u, category, depth + 1) for u in next_urls)
+                store.mark_frontier(url)
+                stats["pages"] += 1
+            print(f"🗂️ Backfill: {stats['pages']} pages, {stats['articles']} articles, "
+                  f"{store.frontier_counts().get('pending', 0)} pages pending")
+    finally:
+        pool.shutdown()
+        if parse_pool is not None:
+            parse_pool.close()
+    return stats
+
+
+# Seconds between automatic retries while RMIT cannot be reached
+REFRESH_RETRY_SECONDS = 60
+
+
+class NewsRefresher:
+    """Stale-while-revalidate front for the news cache.
+
+    Readers always get the cached list straight away, however old; when it
+    has expired a single background thread re-scrapes, and the cache swaps
+    the new list in once the scrape is stored.
+    """
+
+    def __init__(self, cache=None, retry_seconds=REFRESH_RETRY_SECONDS):
+        self.cache = cache or get_news_cache()
+        self.last_error = None
+        # After a failed refresh, stale reads wait this long before retrying
+        self.retry_seconds = retry_seconds
+        self._failed_at = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def is_refreshing(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_snapshot(self):
+        """Current snapshot, kicking off a background refresh if it is stale"""
+        snapshot = self.cache.snapshot()
+        if len(snapshot) < 3 or self.cache.is_stale():
+            self.refresh()
+        return snapshot
+
+    def get_articles(self):
+        return self.get_snapshot().articles
+
+    def refresh(self, force=False):
+        """Start a background refresh; returns False if one is already running"""
+        with self._lock:
+            if self.is_refreshing():
+                return False
+            if not force and not self.cache.is_stale():
+                return False
+            if not force and self._failed_at is not None and time.monotonic() - self._failed_at < self.retry_seconds:
+                return False
+            self._thread = threading.Thread(target=self._run, name="rmit-news-refresh", daemon=True)
+            self._thread.start()
+            return True
+
+    def wait(self, timeout=None):
+        """Block until the running refresh (if any) finishes"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        try:
+            articles = scrape_latest_news()
+        except Exception as e:
+            print(f"❌ Background refresh failed: {e}")
+            self.last_error = str(e)
+            self._failed_at = time.monotonic()
+            return
+        self._failed_at = None
+        self.last_error = None if articles else "No articles found"
+
+    def status(self):
+        """Cache age and refresh state for display"""
+        return {
+            "last_updated": self.cache.last_updated(),
+            "age_seconds": self.cache.age_seconds(),
+            "refreshing": self.is_refreshing(),
+            "article_count": len(self.cache.snapshot()),
+            "last_error": self.last_error,
+        }
+
+
+_refresher = None
+
+def get_refresher():
+    """Process-wide refresher shared by every Streamlit session"""
+    global _refresher
+    with _scraper_lock:
+        if _refresher is None:
+            _refresher = NewsRefresher()
+        return _refresher
+
+def get_live_news(block=False):
+    """Cached articles right away; stale data is revalidated in the background.
+
+    With block=True and nothing cached yet, wait for the first scrape.
+    """
+    refresher = get_refresher()
+    articles = refresher.get_articles()
+    if not articles and block:
+        refresher.wait()
+        articles = refresher.cache.snapshot().articles
+    return articles
+
+def cache_status():
+    return get_refresher().status()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape RMIT news into the article store")
+    parser.add_argument("--backfill", action="store_true",
+                        help="crawl listing pagination to build the archive (resumable)")
+    parser.add_argument("--max-depth", type=int, default=BACKFILL_MAX_DEPTH,
+                        help="pagination hops to follow from each listing")
+    parser.add_argument("--horizon-days", type=int, default=None,
+                        help="stop following pages older than this many days")
+    parser.add_argument("--max-pages", type=int, default=None, help="listing pages to crawl this run")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent page fetches")
+    parser.add_argument("--rate", type=float, default=0.5, help="requests per second per host")
+    parser.add_argument("--burst", type=int, default=3, help="request burst allowed per host")
+    parser.add_argument("--restart", action="store_true", help="forget the frontier and start from the seeds")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="parse pages in this many processes (0 = in the fetch threads)")
+    args = parser.parse_args()
+
+    if not args.backfill:
+        articles = scrape_latest_news()
+        print(f"✅ {len(articles)} recent articles cached")
+        return
+
+    scraper = RMITLiveScraper(max_workers=args.workers, rate_limit=args.rate, burst=args.burst,
+                              archive=get_page_archive())
+    stats = backfill_archive(args.max_depth, args.horizon_days, args.max_pages, scraper, args.restart,
+                             args.parse_workers)
+    print(f"✅ Backfill done: {stats['pages']} pages ({stats['failed']} failed), "
+          f"{stats['articles']} articles, {get_article_store().count()} in the store")
+
 
-def get_live_news():
-    cached_articles = load_news_cache()
-    if cached_articles and len(cached_articles) >= 3:
-        return cached_articles
-    else:
-        print("🌐 Fetching LIVE news from RMIT website")
-        scraper = RMITLiveScraper()
-        live_articles = scraper.fetch_all_news()
-        if live_articles:
-            save_news_cache(live_articles)
-        return live_articles
\ No newline at end of file
+if __name__ == "__main__":
+    main()
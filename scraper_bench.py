@@ -0,0 +1,637 @@
+# scraper_bench.py - Offline benchmarks for rmit_scraper
+import argparse
+import contextlib
+import gc
+import glob
+import io
+import json
+import os
+import platform
+import random
+import re
+import threading
+import time
+import tracemalloc
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from bs4 import BeautifulSoup
+
+import article_store
+import news_search
+import rmit_scraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+TOPICS = [
+    "AI research team builds new cyber security toolkit",
+    "Students win national engineering design award",
+    "New study maps microplastics in Port Phillip Bay",
+    "RMIT partners with industry on digital health platform",
+    "Physics researchers observe new quantum effect",
+    "Vice-Chancellor announces community scholarships",
+    "Fashion graduates showcase sustainable collections",
+    "Robotics lab opens to secondary school visitors",
+]
+
+
+def build_listing_page(n_articles=12, seed=0):
+    """Synthetic listing page shaped like rmit.edu.au/news (nav, cards, footer)"""
+    rng = random.Random(seed)
+    today = datetime(2025, 2, 20)
+    nav = "".join(
+        f'<li><a href="/news/{section}">{section.title()} news and stories</a></li>'
+        for section in ["all-news", "technology", "science", "media-releases", "events"]
+    )
+    cards = []
+    for i in range(n_articles):
+        published = today - timedelta(days=rng.randint(0, 120))
+        title = f"{rng.choice(TOPICS)} ({i})"
+        cards.append(f"""
+        <div class="cmp-card news-card" data-component="card">
+          <a href="/news/all-news/{published.strftime('%Y/%b').lower()}/story-{i}">
+            <h3 class="card-title">{title}</h3>
+          </a>
+          <p class="description">{title}. Researchers and students across the university
+             contributed to this story, which highlights work from our Melbourne campuses.</p>
+          <time datetime="{published:%Y-%m-%d}">{published.day} {published:%B %Y}</time>
+        </div>""")
+    scripts = "".join(f"<script>window.__data{i} = {{\"k\": \"{'x' * 200}\"}};</script>" for i in range(20))
+    return f"""<!DOCTYPE html>
+<html><head><title>News - RMIT University</title>{scripts}</head>
+<body>
+  <header><nav class="mega-menu"><ul>{nav}</ul></nav></header>
+  <main><section class="listing">{''.join(cards)}</section></main>
+  <footer><ul>{nav}</ul><p>RMIT University acknowledges the people of the Woi wurrung and
+  Boon wurrung language groups of the eastern Kulin Nation.</p></footer>
+</body></html>"""
+
+
+def legacy_candidates(soup):
+    """The per-strategy tree queries the scraper issued before single-pass extraction"""
+    soup.find_all('div', class_=re.compile(r'news|card|item', re.I))
+    for selector in rmit_scraper.CARD_SELECTORS:
+        soup.select(selector)
+    soup.find_all('article')
+    soup.find_all('a', href=re.compile(r'/news/'))
+
+
+def count_root_traversals(soup, fn):
+    """Count find_all/select calls made directly on the document root"""
+    calls = {"n": 0}
+    for method_name in ("find_all", "select"):
+        original = getattr(soup, method_name)
+
+        def counted(*args, _original=original, **kwargs):
+            calls["n"] += 1
+            return _original(*args, **kwargs)
+
+        setattr(soup, method_name, counted)
+    fn(soup)
+    return calls["n"]
+
+
+def time_it(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def bench_traversals(n_articles=60, repeat=20):
+    """Compare full-tree traversals and time for legacy vs single-pass candidate collection"""
+    html = build_listing_page(n_articles)
+    scraper = rmit_scraper.RMITLiveScraper()
+    soup = BeautifulSoup(html, "html.parser")
+
+    legacy_walks = count_root_traversals(BeautifulSoup(html, "html.parser"), legacy_candidates)
+    single_walks = count_root_traversals(BeautifulSoup(html, "html.parser"), scraper.collect_candidates)
+
+    return {
+        "articles_on_page": n_articles,
+        "legacy_traversals": legacy_walks,
+        "single_pass_traversals": single_walks,
+        "legacy_ms": time_it(lambda: legacy_candidates(soup), repeat) * 1000,
+        "single_pass_ms": time_it(lambda: scraper.collect_candidates(soup), repeat) * 1000,
+    }
+
+
+# Date strings as they appear on rmit.edu.au listing and article pages
+RMIT_DATE_CORPUS = [
+    "2025-02-18T09:30:00+11:00", "2025-02-17", "2024-12-12T00:00:00Z",
+    "18 February 2025", "14th February 2025", "3 February 2025", "1st March 2024",
+    "17 Feb 2025", "12 Feb 2025", "28 Jan 2025", "12 Dec 2024",
+    "Feb 10, 2025", "January 22, 2025", "05/01/2025", "22/11/2024",
+    "Published: 2025-01-22", "Updated 2025-02-01 10:00", "Semester 1, 2025",
+]
+
+
+def legacy_calculate_days_ago(date_text):
+    """calculate_days_ago as it was before precompiled patterns and caching"""
+    if not date_text:
+        return 0
+    s = date_text.strip()
+    s = re.sub(r'(\d{1,2})(st|nd|rd|th)', r'\1', s, flags=re.IGNORECASE)
+    s = s.replace('\xa0', ' ').replace('–', '-').strip()
+    for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%d %b %Y', '%d %B %Y', '%b %d, %Y', '%B %d, %Y']:
+        try:
+            return max(0, (datetime.now() - datetime.strptime(s, fmt)).days)
+        except ValueError:
+            pass
+    m = re.search(r'(\d{4}-\d{2}-\d{2})', s)
+    if m:
+        try:
+            return max(0, (datetime.now() - datetime.strptime(m.group(1), '%Y-%m-%d')).days)
+        except Exception:
+            pass
+    return 0
+
+
+def bench_dates(rounds=200):
+    """Per-string cost of date normalisation: legacy loop, uncached and cached"""
+    scraper = rmit_scraper.RMITLiveScraper()
+    corpus = RMIT_DATE_CORPUS * rounds
+
+    uncached = rmit_scraper.parse_date_text.__wrapped__
+    rmit_scraper.parse_date_text.cache_clear()
+    per_string = lambda fn: time_it(lambda: [fn(t) for t in corpus], 1) / len(corpus) * 1e6
+    return {
+        "strings": len(corpus),
+        "legacy_us": per_string(legacy_calculate_days_ago),
+        "uncached_us": per_string(uncached),
+        "cached_us": per_string(scraper.calculate_days_ago),
+        "cache": rmit_scraper.parse_date_text.cache_info()._asdict(),
+    }
+
+
+def synthetic_article_json(n, seed=0):
+    """JSON for n scraped-style article dicts, as the cache/store would hand them back"""
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1, tzinfo=rmit_scraper.RMIT_TZ)
+    articles = []
+    for i in range(n):
+        published_at = start + timedelta(hours=rng.randint(0, 24 * 365 * 5))
+        title = f"{rng.choice(TOPICS)} ({i})"
+        articles.append({
+            "title": title,
+            "link": f"https://www.rmit.edu.au/news/all-news/{published_at:%Y/%b}/story-{i}".lower(),
+            "summary": f"{title}. Researchers and students across the university contributed to this story.",
+            "published": rmit_scraper.format_published(published_at),
+            "published_at": published_at.isoformat(),
+            "category": rng.choice(rmit_scraper.CATEGORY_LABELS),
+            "source": "live_rmit",
+        })
+    return json.dumps(articles)
+
+
+def retained_kb(build):
+    """Memory still held by whatever `build` returns, after temporaries are freed"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        kb = tracemalloc.get_traced_memory()[0] / 1024
+    finally:
+        tracemalloc.stop()
+    del result
+    return kb
+
+
+def bench_article_memory(sizes=(10_000, 100_000)):
+    """Retained memory of an archive held as dicts vs Article records"""
+    results = {}
+    for n in sizes:
+        blob = synthetic_article_json(n)
+        dict_kb = retained_kb(lambda: json.loads(blob))
+        record_kb = retained_kb(lambda: [rmit_scraper.Article.from_dict(a) for a in json.loads(blob)])
+        results[n] = {"dict_kb": dict_kb, "record_kb": record_kb}
+    return results
+
+
+SEARCH_QUESTIONS = [
+    "What research breakthroughs happened recently?",
+    "Any news about student awards?",
+    "industry partnerships in technology",
+    "sustainability and climate projects",
+]
+
+
+def bench_search(n_articles=10_000, repeat=50):
+    """BM25 index build time and per-query latency over n synthetic articles.
+
+    The first queries after a build also compute the cached term weights;
+    later ones are timed unfiltered and with a category and 90-day filter.
+    """
+    articles = json.loads(synthetic_article_json(n_articles))
+    index = news_search.BM25Index()
+    start = time.perf_counter()
+    for article in articles:
+        rmit_scraper.index_article(index, article)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    def per_query_ms(rounds, **filters):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for question in SEARCH_QUESTIONS:
+                index.search(question, k=8, **filters)
+        return (time.perf_counter() - start) * 1000 / (rounds * len(SEARCH_QUESTIONS))
+
+    since = max(a["published_at"] for a in articles)
+    since = datetime.fromisoformat(since).timestamp() - 90 * 86400
+    return {
+        "build_ms": build_ms,
+        "first_query_ms": per_query_ms(1),
+        "query_ms": per_query_ms(repeat),
+        "filtered_query_ms": per_query_ms(repeat, category="Science", published_since=since),
+    }
+
+
+def stored_articles(n):
+    """n synthetic articles as the store hands them back (UTC timestamps), as records"""
+    store = article_store.ArticleStore(":memory:")
+    try:
+        store.upsert(json.loads(synthetic_article_json(n)))
+        return tuple(rmit_scraper.Article.from_dict(a) for a in store.query())
+    finally:
+        store.close()
+
+
+def bench_filter_index(sizes=(200, 1_000, 5_000, 10_000), repeat=3):
+    """FilterIndex over n stored articles: list scan vs frame build plus index.
+
+    Each run builds the index, reads every count and materialises one list,
+    which is what a Quick Stats and preview render does.
+    """
+    def render(articles, use_frame):
+        frame = rmit_scraper.build_article_frame(articles) if use_frame else None
+        index = rmit_scraper.FilterIndex(articles, frame)
+        for period in rmit_scraper.TIME_PERIOD_DAYS:
+            for category in rmit_scraper.CATEGORY_LABELS:
+                index.count(category, period)
+        return index.articles("All News", "Last 30 Days")
+
+    results = {}
+    for n in sizes:
+        articles = stored_articles(n)
+        results[n] = {"list_ms": time_it(lambda: render(articles, False), repeat) * 1000}
+        if rmit_scraper.pd is not None:
+            results[n]["frame_ms"] = time_it(lambda: render(articles, True), repeat) * 1000
+    return results
+
+
+def bench_parse_scaling(n_pages=200, worker_counts=None):
+    """Listing pages parsed per second in-process and by ParsePool per worker count"""
+    cpus = os.cpu_count() or 1
+    worker_counts = worker_counts or sorted({1, 2, 4, cpus} - {n for n in (2, 4) if n > cpus})
+    url = "https://www.rmit.edu.au/news/all-news"
+    pages = [(build_listing_page(24, seed=i).encode("utf-8"), "all_news", url) for i in range(n_pages)]
+
+    scraper = rmit_scraper.RMITLiveScraper(concurrent=False)
+    expected = []
+    start = time.perf_counter()
+    for content, category, page_url in pages:
+        expected.append(scraper.parse_listing_page(content, category, page_url))
+    results = {"in_process": n_pages / (time.perf_counter() - start)}
+
+    for workers in worker_counts:
+        with rmit_scraper.ParsePool(workers, scraper.parser_backend) as pool:
+            # Spin up and warm the workers outside the timed run
+            list(pool.parse(pages[:workers]))
+            start = time.perf_counter()
+            parsed = list(pool.parse(pages, chunksize=4))
+            results[workers] = n_pages / (time.perf_counter() - start)
+        for (articles, next_urls), (want_articles, want_next) in zip(parsed, expected):
+            assert next_urls == want_next
+            assert [a["link"] for a in articles] == [a["link"] for a in want_articles]
+    return results
+
+
+# Recorded pages served by the local stand-in, by request path
+FIXTURE_ROUTES = {
+    "/news/all-news": "rmit_all_news.html",
+    "/news/technology": "rmit_technology.html",
+    "/news/science": "rmit_science.html",
+    "/news/all-news/2025/mar/coffee-concrete": "rmit_article.html",
+}
+# Cards on a real listing page; ?scale=N serves a synthetic page with N times as many
+BASE_LISTING_ARTICLES = 12
+SCALES = (1, 10, 100)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves recorded fixtures, or synthetic listings for ?scale=N"""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        scale = int(parse_qs(url.query).get("scale", ["1"])[0])
+        if scale > 1:
+            body = self.server.scaled_page(url.path, scale)
+        elif url.path in FIXTURE_ROUTES:
+            body = self.server.pages[FIXTURE_ROUTES[url.path]]
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_fixtures():
+    """Start the local stand-in for rmit.edu.au; returns (server, base URL)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.pages = load_fixture_pages()
+    scaled = {}
+
+    def scaled_page(path, scale):
+        if (path, scale) not in scaled:
+            # crc32 rather than hash(), which is salted per process, so every
+            # run serves the same pages and --compare compares like with like
+            seed = zlib.crc32(path.encode("utf-8")) % 1000
+            scaled[path, scale] = build_listing_page(BASE_LISTING_ARTICLES * scale, seed=seed).encode("utf-8")
+        return scaled[path, scale]
+
+    server.scaled_page = scaled_page
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def local_scraper(base_url, scale=1):
+    """A scraper whose listing URLs point at the stand-in, without rate limiting"""
+    scraper = rmit_scraper.RMITLiveScraper(rate_limit=10_000, burst=10_000)
+    query = f"?scale={scale}" if scale > 1 else ""
+    scraper.news_urls = {
+        category: base_url + urlparse(url).path + query for category, url in scraper.news_urls.items()
+    }
+    return scraper
+
+
+def bench_fetch_all_news(base_url, scales=SCALES, repeat=5):
+    """End-to-end fetch_all_news over the stand-in at each page scale"""
+    results = {}
+    for scale in scales:
+        timings, articles = [], []
+        for _ in range(repeat):
+            # A fresh scraper each time, so no request is answered from ETags
+            scraper = local_scraper(base_url, scale)
+            start = time.perf_counter()
+            # The scraper's progress logging would swamp the results
+            with contextlib.redirect_stdout(io.StringIO()):
+                articles = scraper.fetch_all_news()
+            timings.append((time.perf_counter() - start) * 1000)
+            scraper.session.close()
+        results[f"x{scale}"] = {
+            "articles": len(articles),
+            "median_ms": sorted(timings)[len(timings) // 2],
+            "min_ms": min(timings),
+        }
+    return results
+
+
+def strategy_pages(server):
+    """Listing pages for per-strategy timing: the recorded fixtures and scaled synthetics"""
+    pages = {name: content for name, content in server.pages.items() if name != "rmit_article.html"}
+    for scale in SCALES[1:]:
+        pages[f"synthetic_x{scale}"] = server.scaled_page("/news/all-news", scale)
+    return pages
+
+
+def bench_strategies(pages, repeat=5):
+    """Parse, candidate collection and each strategy's extraction time per page"""
+    scraper = rmit_scraper.RMITLiveScraper()
+    strategies = [
+        scraper.scrape_modern_news_layout,
+        scraper.scrape_news_cards,
+        scraper.scrape_article_tags,
+        scraper.scrape_news_links,
+    ]
+    results = {}
+    for name, content in pages.items():
+        soup = rmit_scraper.make_soup(content, scraper.parser_backend)
+        candidates = scraper.collect_candidates(soup)
+        page = {
+            "bytes": len(content),
+            "parse_ms": time_it(lambda: rmit_scraper.make_soup(content, scraper.parser_backend), repeat) * 1000,
+            "collect_candidates_ms": time_it(lambda: scraper.collect_candidates(soup), repeat) * 1000,
+        }
+        for strategy in strategies:
+            page[f"{strategy.__name__}_ms"] = time_it(lambda: strategy(soup, "all_news", candidates), repeat) * 1000
+            page[f"{strategy.__name__}_articles"] = len(strategy(soup, "all_news", candidates))
+        page["pipeline_ms"] = time_it(lambda: scraper.scrape_with_multiple_strategies(soup, "all_news"), repeat) * 1000
+        results[name] = page
+    return results
+
+
+def bench_categories(rounds=500):
+    """Per-article cost of detect_category over titles and summaries like the listings'"""
+    scraper = rmit_scraper.RMITLiveScraper()
+    corpus = [(title, f"{title}. Researchers and students across the university contributed.")
+              for title in TOPICS] * rounds
+    elapsed = time_it(lambda: [scraper.detect_category(t, s, "all_news") for t, s in corpus], 1)
+    labels = {}
+    for title, summary in corpus[:len(TOPICS)]:
+        label = scraper.detect_category(title, summary, "all_news")
+        labels[label] = labels.get(label, 0) + 1
+    return {"articles": len(corpus), "per_article_us": elapsed / len(corpus) * 1e6, "labels": labels}
+
+
+def run_suite(repeat=5):
+    """Every offline scraper benchmark, as one JSON-serialisable dict"""
+    server, base_url = serve_fixtures()
+    try:
+        dates = bench_dates()
+        dates.pop("cache", None)
+        return {
+            "meta": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "parser_backend": rmit_scraper.select_parser_backend(),
+            },
+            "fetch_all_news": bench_fetch_all_news(base_url, repeat=repeat),
+            "strategies": bench_strategies(strategy_pages(server), repeat),
+            "dates": dates,
+            "categories": bench_categories(),
+            "filter_index": {str(n): timings for n, timings in bench_filter_index().items()},
+        }
+    finally:
+        server.shutdown()
+
+
+def flatten_timings(results, prefix=""):
+    """{"section.page.metric": value} for every *_ms / *_us figure"""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_timings(value, name + "."))
+        elif isinstance(value, (int, float)) and (key.endswith("_ms") or key.endswith("_us")):
+            flat[name] = value
+    return flat
+
+
+def compare_results(baseline, current, threshold=0.10, floor_ms=0.05):
+    """Print each timing against a baseline run, flagging slowdowns over `threshold`.
+
+    Millisecond timings under `floor_ms` in both runs are timer noise and skipped.
+    """
+    old, new = flatten_timings(baseline), flatten_timings(current)
+    regressions = 0
+    for name in sorted(new):
+        if name not in old or not old[name]:
+            continue
+        if name.endswith("_ms") and max(old[name], new[name]) < floor_ms:
+            continue
+        change = new[name] / old[name] - 1
+        flag = "⚠️" if change > threshold else "  "
+        regressions += change > threshold
+        print(f"{flag} {name}: {old[name]:.3f} -> {new[name]:.3f} ({change:+.0%})")
+    print(f"📉 {regressions} timings more than {threshold:.0%} slower than the baseline")
+    return regressions
+
+
+def load_fixture_pages():
+    """Saved listing pages from fixtures/, keyed by file name"""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        with open(path, "rb") as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+def extract_with_backend(content, backend, category="all_news"):
+    """Run the full strategy pipeline on one page with a given parser backend"""
+    scraper = rmit_scraper.RMITLiveScraper(parser_backend=backend)
+    soup = rmit_scraper.make_soup(content, backend)
+    return scraper.scrape_with_multiple_strategies(soup, category)
+
+
+def check_backends():
+    """Assert every installed parser backend extracts identical articles from the fixtures"""
+    backends = rmit_scraper.available_parser_backends()
+    pages = load_fixture_pages()
+    pages["synthetic_60.html"] = build_listing_page(60).encode("utf-8")
+    for name, content in pages.items():
+        reference = extract_with_backend(content, "html.parser")
+        for backend in backends:
+            result = extract_with_backend(content, backend)
+            if result != reference:
+                raise AssertionError(f"{backend} differs from html.parser on {name}")
+        print(f"✅ {name}: {len(reference)} articles identical on {', '.join(backends)}")
+    return backends
+
+
+def bench_backends(repeat=10):
+    """Parse time per backend for each fixture page"""
+    results = {}
+    for name, content in load_fixture_pages().items():
+        results[name] = {
+            backend: time_it(lambda: rmit_scraper.make_soup(content, backend), repeat) * 1000
+            for backend in rmit_scraper.available_parser_backends()
+        }
+    return results
+
+
+def peak_memory_kb(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def bench_partial_parse(n_articles=60, repeat=10):
+    """Parse time and peak memory for a full tree vs the listing SoupStrainer"""
+    html = build_listing_page(n_articles)
+    full = lambda: rmit_scraper.make_soup(html)
+    partial = lambda: rmit_scraper.make_soup(html, parse_only=rmit_scraper.LISTING_STRAINER)
+    scraper = rmit_scraper.RMITLiveScraper()
+    return {
+        "full_ms": time_it(full, repeat) * 1000,
+        "partial_ms": time_it(partial, repeat) * 1000,
+        "full_peak_kb": peak_memory_kb(full),
+        "partial_peak_kb": peak_memory_kb(partial),
+        "full_articles": len(scraper.scrape_with_multiple_strategies(full(), "all_news")),
+        "partial_articles": len(scraper.scrape_with_multiple_strategies(partial(), "all_news")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline rmit_scraper benchmarks")
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--check-backends", action="store_true",
+                        help="verify all parser backends extract identical articles")
+    parser.add_argument("--parse-scaling", action="store_true",
+                        help="measure ParsePool throughput for 1..N worker processes")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--filter-index", action="store_true",
+                        help="compare list-scan and frame FilterIndex builds by archive size")
+    parser.add_argument("--suite", action="store_true",
+                        help="run the end-to-end suite against a local stand-in and print JSON")
+    parser.add_argument("--json", metavar="PATH", help="also write the suite results to PATH")
+    parser.add_argument("--compare", metavar="PATH", help="compare the suite against an earlier JSON run")
+    args = parser.parse_args()
+
+    if args.suite or args.json or args.compare:
+        results = run_suite(min(args.repeat, 5))
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"💾 Results written to {args.json}")
+        if args.compare:
+            with open(args.compare, encoding="utf-8") as f:
+                compare_results(json.load(f), results)
+        if not args.json and not args.compare:
+            print(json.dumps(results, indent=2))
+        return
+
+    if args.check_backends:
+        check_backends()
+        return
+    if args.parse_scaling:
+        results = bench_parse_scaling(args.pages)
+        print(f"🧵 In-process: {results.pop('in_process'):.0f} pages/s")
+        for workers, rate in results.items():
+            print(f"🚀 {workers} parse worker(s): {rate:.0f} pages/s")
+        return
+
+    if args.filter_index:
+        for n, timings in bench_filter_index().items():
+            frame_ms = timings.get("frame_ms")
+            frame_text = f"frame {frame_ms:.1f} ms" if frame_ms is not None else "no pandas"
+            print(f"🗂️ FilterIndex over {n:,} articles: list {timings['list_ms']:.1f} ms, {frame_text}")
+        return
+
+    result = bench_traversals(args.articles, args.repeat)
+    print(f"📐 Traversals per page: {result['legacy_traversals']} -> {result['single_pass_traversals']}")
+    print(f"⏱️ Candidate collection: {result['legacy_ms']:.2f} ms -> {result['single_pass_ms']:.2f} ms")
+    for name, timings in bench_backends().items():
+        summary = ", ".join(f"{backend} {ms:.2f} ms" for backend, ms in timings.items())
+        print(f"🧩 Parse {name}: {summary}")
+    dates = bench_dates()
+    print(f"📅 Date parsing per string: legacy {dates['legacy_us']:.1f} µs, "
+          f"uncached {dates['uncached_us']:.1f} µs, cached {dates['cached_us']:.1f} µs")
+    for n, mem in bench_article_memory().items():
+        print(f"🧠 {n:,} articles: dicts {mem['dict_kb'] / 1024:.1f} MB -> "
+              f"records {mem['record_kb'] / 1024:.1f} MB")
+    search = bench_search()
+    print(f"🔎 BM25 over 10,000 articles: build {search['build_ms']:.0f} ms, "
+          f"first query {search['first_query_ms']:.2f} ms, query {search['query_ms']:.2f} ms, "
+          f"filtered {search['filtered_query_ms']:.2f} ms")
+    partial = bench_partial_parse(args.articles)
+    print(f"✂️ Partial parse: {partial['full_ms']:.2f} ms -> {partial['partial_ms']:.2f} ms, "
+          f"peak {partial['full_peak_kb']:.0f} KB -> {partial['partial_peak_kb']:.0f} KB, "
+          f"articles {partial['full_articles']} -> {partial['partial_articles']}")
+
+
+if __name__ == "__main__":
+    main()
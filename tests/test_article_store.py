@@ -0,0 +1,32 @@
+import article_store
+import rmit_scraper
+
+LINK = "https://www.rmit.edu.au/news/all-news/2025/feb/quantum-sensor"
+ENRICHED = {"title": "Quantum sensor fits on a chip", "link": LINK,
+            "summary": "Researchers built a quantum sensor that fits on a chip.",
+            "published_at": "2025-02-03T00:00:00+11:00", "category": "Science", "source": "live_rmit"}
+
+
+def test_relisting_keeps_enriched_fields():
+    store = article_store.ArticleStore(":memory:")
+    store.upsert([ENRICHED], is_placeholder=rmit_scraper.needs_enrichment)
+    # A backfill or re-extraction sees the same link as an undated, link-only item
+    store.upsert([{"title": ENRICHED["title"], "link": LINK, "category": "All News", "source": "live_rmit",
+                   "summary": "Recent all_news news from RMIT University", "published_at": None}],
+                 is_placeholder=rmit_scraper.needs_enrichment)
+    [stored] = store.query()
+    assert stored["summary"] == ENRICHED["summary"]
+    assert stored["category"] == "Science"
+    assert stored["published_at"] == "2025-02-02T13:00:00+00:00"
+
+
+def test_real_updates_still_apply():
+    store = article_store.ArticleStore(":memory:")
+    store.upsert([ENRICHED], is_placeholder=rmit_scraper.needs_enrichment)
+    store.upsert([dict(ENRICHED, summary="Updated summary.", category="Technology",
+                       published_at="2025-02-04T00:00:00+11:00")],
+                 is_placeholder=rmit_scraper.needs_enrichment)
+    [stored] = store.query()
+    assert (stored["summary"], stored["category"]) == ("Updated summary.", "Technology")
+    assert stored["published_at"] == "2025-02-03T13:00:00+00:00"
+
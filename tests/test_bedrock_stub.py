@@ -0,0 +1,70 @@
+import pytest
+
+import bedrock_client
+import bedrock_stub
+
+pytest.importorskip("boto3")
+
+QUESTION_PROMPT = '*USER QUESTION:*\n"What research news is there this week?"'
+
+
+@pytest.fixture
+def stub():
+    server, endpoint_url = bedrock_stub.start_stub_server(chunk_delay=0)
+    client = bedrock_client.BedrockClient(
+        bedrock_client.StaticCredentials(), "ap-southeast-2", "stub-model", endpoint_url=endpoint_url
+    )
+    yield server, client
+    server.shutdown()
+
+
+def test_invoke(stub):
+    server, client = stub
+    assert client.invoke(QUESTION_PROMPT) == bedrock_stub.stub_reply(QUESTION_PROMPT)
+    assert server.requests == 1
+
+
+def test_invoke_stream_yields_word_chunks(stub):
+    _, client = stub
+    expected = bedrock_stub.stub_reply(QUESTION_PROMPT)
+    chunks = list(client.invoke_stream(QUESTION_PROMPT))
+    assert chunks == bedrock_stub.split_words(expected)
+    assert len(chunks) > 1
+
+
+def test_cached_stream_is_stored_only_once_complete(stub):
+    server, client = stub
+    cache = bedrock_client.ResponseCache()
+
+    def invoke(prompt_text, stream=False, **kwargs):
+        return client.invoke_stream(prompt_text, **kwargs) if stream else client.invoke(prompt_text, **kwargs)
+
+    chunks, cached = bedrock_client.cached_invoke(cache, "stub-model", QUESTION_PROMPT, 1, invoke, stream=True)
+    assert not cached
+    first = next(chunks)
+    assert len(cache) == 0
+    text = first + "".join(chunks)
+    assert text == bedrock_stub.stub_reply(QUESTION_PROMPT)
+    assert len(cache) == 1
+
+    again, cached = bedrock_client.cached_invoke(cache, "stub-model", QUESTION_PROMPT, 1, invoke, stream=True)
+    assert cached
+    assert "".join(again) == text
+    assert server.requests == 1
+
+
+def test_failed_stream_is_not_cached(stub):
+    _, client = stub
+    cache = bedrock_client.ResponseCache()
+
+    def invoke(prompt_text, stream=False, **kwargs):
+        for i, chunk in enumerate(client.invoke_stream(prompt_text, **kwargs)):
+            if i == 2:
+                raise ConnectionError("stream dropped")
+            yield chunk
+
+    chunks, cached = bedrock_client.cached_invoke(cache, "stub-model", QUESTION_PROMPT, 1, invoke, stream=True)
+    with pytest.raises(ConnectionError):
+        list(chunks)
+    assert len(cache) == 0
+    assert cache.get(bedrock_client.response_key("stub-model", QUESTION_PROMPT, 1)) is None
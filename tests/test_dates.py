@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+import rmit_scraper
+
+# Melbourne publish day of each date string RMIT pages use (None: unparseable)
+MELBOURNE_PUBLISH_DAYS = {
+    "2025-02-18T09:30:00+11:00": date(2025, 2, 18),
+    "2025-02-17": date(2025, 2, 17),
+    "2024-12-12T00:00:00Z": date(2024, 12, 12),
+    # 8pm UTC is already the next morning in Melbourne
+    "2025-02-17T20:00:00Z": date(2025, 2, 18),
+    "18 February 2025": date(2025, 2, 18),
+    "14th February 2025": date(2025, 2, 14),
+    "1st March 2024": date(2024, 3, 1),
+    "28 Jan 2025": date(2025, 1, 28),
+    "Feb 10, 2025": date(2025, 2, 10),
+    "January 22, 2025": date(2025, 1, 22),
+    "05/01/2025": date(2025, 1, 5),
+    "Published: 2025-01-22": date(2025, 1, 22),
+    "Updated 2025-02-01 10:00": date(2025, 2, 1),
+    "Semester 1, 2025": None,
+}
+
+
+@pytest.mark.parametrize("text, published_day", MELBOURNE_PUBLISH_DAYS.items())
+def test_days_ago_counts_melbourne_calendar_days(text, published_day):
+    # Unlike the legacy count of 24-hour periods from naive local time, a
+    # date is one day old from midnight in Melbourne; unparseable text is 0
+    expected = 0 if published_day is None else max(0, (rmit_scraper.rmit_today() - published_day).days)
+    assert rmit_scraper.RMITLiveScraper().calculate_days_ago(text) == expected
+
+
+def test_date_only_articles_display_their_melbourne_day():
+    published_at = rmit_scraper.RMITLiveScraper().published_at_for("18 February 2025")
+    article = {"published_at": published_at.isoformat(), "published": rmit_scraper.format_published(published_at)}
+    # Stored in GMT, where midnight in Melbourne is still the day before
+    assert article["published"] == "Mon, 17 Feb 2025 13:00:00 GMT"
+    assert rmit_scraper.display_published(article) == "Tue, 18 Feb 2025"
+    assert rmit_scraper.display_published({"published_at": None}) == ""
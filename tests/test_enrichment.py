@@ -0,0 +1,90 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import article_store
+import rmit_scraper
+
+
+@pytest.mark.parametrize("summary", [
+    "Latest news from RMIT University",
+    "Latest technology news from RMIT University",
+    "Latest all_news news from RMIT University",
+    "Recent science news from RMIT University",
+])
+def test_placeholder_summaries_need_enrichment(summary):
+    assert rmit_scraper.needs_enrichment({"summary": summary})
+
+
+@pytest.mark.parametrize("summary", [
+    "Latest research news from RMIT University shows record results",
+    "Researchers at RMIT University built a new sensor",
+    "",
+])
+def test_real_summaries_do_not(summary):
+    assert not rmit_scraper.needs_enrichment({"summary": summary})
+
+
+ARTICLE_PAGE = b"""<html><head><title>Quantum sensor | RMIT University</title>
+<meta property="og:description" content="Researchers built a quantum sensor that fits on a chip.">
+</head><body></body></html>"""
+
+
+class ArticlePageHandler(BaseHTTPRequestHandler):
+    """Serves one article page with an ETag and honours If-None-Match"""
+
+    def do_GET(self):
+        self.server.hits.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(ARTICLE_PAGE)))
+        self.end_headers()
+        self.wfile.write(ARTICLE_PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def page_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ArticlePageHandler)
+    server.hits = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = article_store.ArticleStore(":memory:")
+    monkeypatch.setattr(rmit_scraper, "_store", store)
+    yield store
+    store.close()
+
+
+def test_stored_placeholders_are_refilled_with_conditional_gets(page_server, store):
+    server, base_url = page_server
+    placeholder = {"title": "Quantum sensor fits on a chip", "link": f"{base_url}/news/all-news/2025/feb/quantum-sensor",
+                   "summary": "Recent science news from RMIT University", "category": "Science"}
+    store.upsert([placeholder])
+    scraper = rmit_scraper.RMITLiveScraper(rate_limit=100, enrich_details=True)
+
+    # An incremental refresh with no new links still fills in the stored row
+    refilled = rmit_scraper.enrich_articles(scraper, [])
+    assert [a["summary"] for a in refilled] == ["Researchers built a quantum sensor that fits on a chip."]
+    assert server.hits == [None]
+
+    # The caller has not saved the refill, but a recently checked page is left alone
+    assert rmit_scraper.enrich_articles(scraper, []) == []
+    assert len(server.hits) == 1
+
+    # Once due again, the stored ETag makes the re-check a 304
+    store._conn.execute("UPDATE pages SET fetched_at = '2000-01-01T00:00:00'")
+    refilled = rmit_scraper.enrich_articles(scraper, [])
+    assert server.hits == [None, '"v1"']
+    assert [a["summary"] for a in refilled] == ["Researchers built a quantum sensor that fits on a chip."]
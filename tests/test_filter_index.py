@@ -0,0 +1,62 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import article_store
+import rmit_scraper
+
+pytest.importorskip("pandas")
+
+
+def recent_articles(n, seed=0):
+    """n article dicts published over the last 200 days, with local-offset timestamps"""
+    rng = random.Random(seed)
+    now = datetime.now(rmit_scraper.RMIT_TZ)
+    return [{"title": f"Story {seed}-{i}", "link": f"https://www.rmit.edu.au/news/all-news/2025/jan/story-{seed}-{i}",
+             "summary": "A story.", "published_at": (now - timedelta(hours=rng.randint(0, 24 * 200))).isoformat(),
+             "category": rng.choice(rmit_scraper.CATEGORY_LABELS)} for i in range(n)]
+
+
+def mixed_articles():
+    """Stored (UTC) rows plus local-offset, legacy days_ago and undated ones"""
+    store = article_store.ArticleStore(":memory:")
+    store.upsert(recent_articles(300))
+    articles = [rmit_scraper.Article.from_dict(a) for a in store.query()]
+    store.close()
+    articles += [rmit_scraper.Article.from_dict(a) for a in recent_articles(50, seed=3)]
+    articles += [
+        rmit_scraper.Article.from_dict({"title": "Legacy", "link": "/news/legacy", "days_ago": 3, "category": "science"}),
+        rmit_scraper.Article.from_dict({"title": "Undated", "link": "/news/undated", "category": "Technology"}),
+        rmit_scraper.Article.from_dict({"title": "Naive", "link": "/news/naive",
+                                        "published_at": "2025-02-18T09:00:00", "category": "Technology"}),
+    ]
+    return tuple(articles)
+
+
+def test_frame_index_matches_list_scan():
+    articles = mixed_articles()
+    listed = rmit_scraper.FilterIndex(articles)
+    framed = rmit_scraper.FilterIndex(articles, rmit_scraper.build_article_frame(articles), listed.today)
+    for period in rmit_scraper.TIME_PERIOD_DAYS:
+        for category in rmit_scraper.CATEGORY_LABELS:
+            assert framed.count(category, period) == listed.count(category, period)
+            assert framed.articles(category, period) == listed.articles(category, period)
+
+
+def test_snapshot_index_covers_stored_history(monkeypatch):
+    store = article_store.ArticleStore(":memory:")
+    monkeypatch.setattr(rmit_scraper, "_store", store)
+    n = rmit_scraper.FRAME_MIN_ARTICLES + 100
+    store.upsert([{"title": f"Story {i}", "link": f"https://www.rmit.edu.au/news/all-news/2024/jan/story-{i}",
+                   "summary": "A story.", "published_at": f"2024-01-{1 + i % 28:02d}T00:00:00+00:00",
+                   "category": "Science" if i % 2 else "Technology"} for i in range(n)])
+    cache = rmit_scraper.NewsCache()
+    cache.put([])
+    snapshot = cache.snapshot()
+    assert len(snapshot) == rmit_scraper.MAX_CACHED_ARTICLES
+    assert snapshot.filter_index.count() == n
+    assert snapshot.filter_index.count("Science") == n // 2
+    # Past the threshold the index is built from the frame
+    assert snapshot._frame is not None
+    store.close()
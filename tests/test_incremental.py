@@ -0,0 +1,39 @@
+import rmit_scraper
+
+NAV = "".join(
+    f'<li><a href="/news/{section}">{section.title()} news and stories</a></li>'
+    for section in ["all-news", "technology", "science", "media-releases", "events"]
+)
+
+
+def card(slug, title, day):
+    return f"""<div class="cmp-card news-card" data-component="card">
+      <a href="/news/all-news/2025/feb/{slug}"><h3 class="card-title">{title}</h3></a>
+      <p class="description">{title}. A story from our Melbourne campuses.</p>
+      <time datetime="2025-02-{day:02d}">{day} February 2025</time></div>"""
+
+
+def listing(cards):
+    return f"""<html><body><header><nav><ul>{NAV}</ul></nav></header>
+    <main><section class="listing">{''.join(cards)}</section></main>
+    <footer><ul>{NAV}</ul></footer></body></html>""".encode("utf-8")
+
+
+CARDS = [card(f"story-{i}", f"Research story number {i} from the lab", 10 + i) for i in range(3)]
+
+
+def test_section_links_are_not_articles():
+    articles = rmit_scraper.RMITLiveScraper().extract_articles(listing(CARDS), "all_news")
+    assert [a["link"].rsplit("/", 1)[-1] for a in articles] == ["story-0", "story-1", "story-2"]
+
+
+def test_known_nav_links_do_not_stop_an_incremental_walk():
+    scraper = rmit_scraper.RMITLiveScraper()
+    known = scraper.extract_articles(listing(CARDS), "all_news")
+    # Even if nav links were stored by an older scrape, they must not count
+    scraper.known_links = {rmit_scraper.normalise_link(a["link"]) for a in known}
+    scraper.known_links |= {rmit_scraper.normalise_link(f"https://www.rmit.edu.au/news/{s}")
+                            for s in ["all-news", "technology", "science", "media-releases", "events"]}
+    fresh = card("brand-new", "Brand new research story today", 21)
+    articles = scraper.extract_articles(listing([fresh] + CARDS), "all_news")
+    assert [a["link"].rsplit("/", 1)[-1] for a in articles] == ["brand-new"]
@@ -0,0 +1,57 @@
+import glob
+import os
+
+import pytest
+
+import rmit_scraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+
+
+def synthetic_listing(n_articles):
+    """A long listing with nav, cards in both date styles and a footer"""
+    nav = "".join(f'<li><a href="/news/{s}">{s.title()} news</a></li>' for s in ["all-news", "technology", "science"])
+    cards = "".join(f"""
+        <div class="cmp-card news-card" data-component="card">
+          <a href="/news/all-news/2025/jan/story-{i}"><h3 class="card-title">Research story number {i}</h3></a>
+          <p class="description">Story {i} from the lab, with work from our Melbourne campuses.</p>
+          <time datetime="2025-01-{1 + i % 28:02d}">{1 + i % 28} January 2025</time>
+        </div>""" for i in range(n_articles))
+    return f"""<!DOCTYPE html><html><head><title>News</title></head><body>
+      <header><nav><ul>{nav}</ul></nav></header><main><section>{cards}</section></main>
+      <footer><ul>{nav}</ul></footer></body></html>""".encode("utf-8")
+
+
+PAGES = {}
+for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+    with open(path, "rb") as f:
+        PAGES[os.path.basename(path)] = f.read()
+PAGES["synthetic_60.html"] = synthetic_listing(60)
+
+
+def extract(content, backend):
+    scraper = rmit_scraper.RMITLiveScraper(parser_backend=backend)
+    return scraper.scrape_with_multiple_strategies(rmit_scraper.make_soup(content, backend), "all_news")
+
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+@pytest.mark.parametrize("backend", rmit_scraper.available_parser_backends())
+def test_backend_matches_html_parser(name, backend):
+    reference = extract(PAGES[name], "html.parser")
+    assert reference, f"no articles extracted from {name}"
+    assert extract(PAGES[name], backend) == reference
+
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_partial_parse_matches_full_parse(name):
+    full = rmit_scraper.RMITLiveScraper().extract_articles(PAGES[name], "all_news")
+    scraper = rmit_scraper.RMITLiveScraper(partial_parse=True, partial_parse_min_articles=0)
+    assert scraper.extract_articles(PAGES[name], "all_news") == full
+
+
+def test_partial_parse_falls_back_when_a_link_loses_its_date():
+    page = b"""<html><body><p><a href="/news/all-news/2024/dec/open-day">Open day draws record crowds to campus</a>
+      12 Dec 2024</p></body></html>"""
+    scraper = rmit_scraper.RMITLiveScraper(partial_parse=True, partial_parse_min_articles=0)
+    [article] = scraper.extract_articles(page, "all_news")
+    assert article["published_at"].startswith("2024-12-12")
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+import article_store
+import news_search
+import rmit_scraper
+
+TOPICS = [
+    "AI research team builds new cyber security toolkit",
+    "Students win national engineering design award",
+    "New study maps microplastics in Port Phillip Bay",
+    "Physics researchers observe new quantum effect",
+]
+QUESTIONS = [
+    "What research breakthroughs happened recently?",
+    "Any news about student awards?",
+    "industry partnerships in technology",
+    "sustainability and climate projects",
+    "quantum award",
+]
+
+
+def synthetic_articles(n, seed=0):
+    """Articles with heavily repeated wording, so rankings are full of ties"""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(n):
+        title = f"{rng.choice(TOPICS)} ({i})"
+        articles.append({
+            "title": title,
+            "link": f"https://www.rmit.edu.au/news/all-news/2024/jan/story-{i}",
+            "summary": f"{title}. Researchers and students across the university contributed to this story.",
+            "published_at": f"20{rng.randint(20, 24)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T00:00:00+00:00",
+            "category": rng.choice(rmit_scraper.CATEGORY_LABELS),
+        })
+    return articles
+
+
+def build_index(n=500):
+    index = news_search.BM25Index()
+    articles = synthetic_articles(n)
+    for article in articles:
+        rmit_scraper.index_article(index, article)
+    # Re-adding a key replaces it, which must invalidate the cached weights
+    for article in articles[:20]:
+        rmit_scraper.index_article(index, dict(article, summary="Quantum sustainability award for students"))
+    return index
+
+
+FILTERS = [{}, {"category": "Science"}, {"published_since": 1.65e9},
+           {"category": "technology", "published_since": 1.6e9}]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("question", QUESTIONS)
+def test_array_scoring_matches_pure_python(monkeypatch, question, filters):
+    pytest.importorskip("numpy")
+    with_arrays = build_index().search(question, k=8, **filters)
+    monkeypatch.setattr(news_search, "np", None)
+    pure = build_index().search(question, k=8, **filters)
+    assert [key for key, _ in with_arrays] == [key for key, _ in pure]
+    assert [score for _, score in with_arrays] == pytest.approx([score for _, score in pure])
+
+
+def test_filters_exclude_other_categories_and_older_articles():
+    index = news_search.BM25Index()
+    index.add("a", "Quantum lab opens", "", "Science", 2_000)
+    index.add("b", "Quantum startup", "", "Technology", 2_000)
+    index.add("c", "Quantum history", "", "Science", 1_000)
+    index.add("d", "Quantum undated", "", "Science", None)
+    assert [key for key, _ in index.search("quantum", category="science", published_since=1_500)] == ["a"]
+    assert {key for key, _ in index.search("quantum")} == {"a", "b", "c", "d"}
+
+
+def test_search_index_seeds_outside_the_cache_lock(monkeypatch):
+    store = article_store.ArticleStore(":memory:")
+    monkeypatch.setattr(rmit_scraper, "_store", store)
+    store.upsert(synthetic_articles(20))
+    cache = rmit_scraper.NewsCache()
+    seeding_locked = []
+    query = store.query
+
+    def checked_query(*args, **kwargs):
+        seeding_locked.append(cache._lock.locked())
+        return query(*args, **kwargs)
+
+    monkeypatch.setattr(store, "query", checked_query)
+    index = cache.search_index()
+    assert seeding_locked == [False]
+    assert cache.search_index() is index
+    # Later refreshes feed the published index
+    cache.put([{"title": "Quantum sensor wins award", "link": "https://www.rmit.edu.au/news/all-news/2025/feb/quantum-sensor",
+                "summary": "A quantum sensor.", "category": "Science"}])
+    assert index.search("quantum sensor", k=1)[0][0] == "https://www.rmit.edu.au/news/all-news/2025/feb/quantum-sensor"
+    store.close()